@@ -6,21 +6,33 @@ Contains the core Hangman game logic.
 
 This module defines the HangmanGame class, which encapsulates the state and
 rules of a single round of Hangman. It tracks the secret word, guessed letters,
-and win/loss conditions.
+and win/loss conditions. Guessed letters are stored as a 26-bit integer mask
+(bit i = chr(ord('a') + i)) so membership and win checks are single bitwise ops.
 
 Author: @seanl
-Version: 1.3.0
+Version: 1.6.0
 Creation Date: 11/20/2025
-Last Updated: 12/25/2025
+Last Updated: 10/15/2026
 """
 
-from typing import Set, Optional
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple, Type
 import random
 
 
 DEFAULT_MAX_ATTEMPTS: int = 6
 HINT_COST: int = 2
-AUTO_REVEAL_LETTERS: Set[str] = {'r', 's', 't', 'l', 'n', 'e'}
+AUTO_REVEAL_LETTERS: FrozenSet[str] = frozenset('rstlne')
+
+# Letter <-> bit tables built once at import. A dict lookup both validates a guess
+# (only a-z are keys) and yields its bit, replacing ord() arithmetic in hot paths.
+_BIT_LETTERS: Tuple[str, ...] = tuple("abcdefghijklmnopqrstuvwxyz")
+_LETTER_BITS: Dict[str, int] = {letter: 1 << index for index, letter in enumerate(_BIT_LETTERS)}
+
+_AUTO_REVEAL_MASK: int = sum(_LETTER_BITS[letter] for letter in AUTO_REVEAL_LETTERS)
+
+# Bound once so useHint avoids the module attribute lookup on every call.
+_randrange = random.randrange
 
 
 class HangmanGame:
@@ -28,39 +40,143 @@ class HangmanGame:
     Encapsulates the logic and state of a Hangman game round.
     """
 
+    __slots__ = (
+        "secret_word",
+        "_used_mask",
+        "_max_attempts",
+        "_wrong_guesses",
+        "_is_lost",
+        "_secret_mask",
+        "_secret_chars",
+        "_won_cached",
+        "_masked_word",
+    )
+
     def __init__(self, secret_word: str, max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> None:
-        self.secret_word: str = secret_word.lower()
-        self.max_attempts: int = max_attempts
-        self.used_letters: Set[str] = set()
-        self.wrong_guesses: int = 0
+        self._max_attempts: int = max_attempts
+        self._wrong_guesses: int = 0
+        self._is_lost: bool = max_attempts <= 0
+        self._used_mask: int = 0
+        self._won_cached: Optional[bool] = None
+        self._masked_word: Optional[str] = None
+        self._setSecretWord(secret_word)
         self._autoRevealCommonLetters()
 
     def resetGame(self, new_secret_word: str) -> None:
         """
         Reset the game state with a new secret word.
         """
-        self.secret_word = new_secret_word.lower()
-        self.used_letters.clear()
+        self._used_mask = 0
         self.wrong_guesses = 0
+        self._setSecretWord(new_secret_word)
         self._autoRevealCommonLetters()
 
+    def _invalidate(self) -> None:
+        """
+        Drop cached derived state after used_mask or the secret word changes.
+        """
+        self._won_cached = None
+        self._masked_word = None
+
+    def _setSecretWord(self, secret_word: str) -> None:
+        """
+        Store the normalized secret word and precompute its letter bitmasks.
+
+        Args:
+            secret_word: The word to guess; case is ignored.
+        """
+        self.secret_word: str = secret_word.lower()
+        self._secret_mask: int = 0
+        for char in self.secret_word:
+            self._secret_mask |= _LETTER_BITS.get(char, 0)
+        self._secret_chars: Optional[FrozenSet[str]] = None
+        self._invalidate()
+
+    @property
+    def secret_chars(self) -> FrozenSet[str]:
+        """
+        Return the distinct characters of the secret word, computed on first access
+        and kept until the next reset.
+        """
+        if self._secret_chars is None:
+            self._secret_chars = frozenset(self.secret_word)
+        return self._secret_chars
+
+    @property
+    def max_attempts(self) -> int:
+        """
+        Return the number of wrong guesses allowed before the game is lost.
+        """
+        return self._max_attempts
+
+    @max_attempts.setter
+    def max_attempts(self, value: int) -> None:
+        self._max_attempts = value
+        self._is_lost = self._wrong_guesses >= value
+
+    @property
+    def wrong_guesses(self) -> int:
+        """
+        Return the number of wrong guesses (hints count as HINT_COST each).
+        """
+        return self._wrong_guesses
+
+    @wrong_guesses.setter
+    def wrong_guesses(self, value: int) -> None:
+        self._wrong_guesses = value
+        self._is_lost = value >= self._max_attempts
+
+    @property
+    def used_mask(self) -> int:
+        """
+        Return the guessed letters as a 26-bit mask (bit i = chr(ord('a') + i)).
+
+        Read-only: writes go through used_letters, guesses or hints, which all
+        drop the cached win state and masked word.
+        """
+        return self._used_mask
+
+    @property
+    def used_letters(self) -> FrozenSet[str]:
+        """
+        Return the guessed letters as a set, materialized from the mask on demand.
+        """
+        return frozenset(
+            letter for index, letter in enumerate(_BIT_LETTERS) if self._used_mask >> index & 1
+        )
+
+    @used_letters.setter
+    def used_letters(self, letters: Iterable[str]) -> None:
+        mask = 0
+        for letter in letters:
+            mask |= _LETTER_BITS.get(letter.lower(), 0)
+        self._used_mask = mask
+        self._invalidate()
+
     def _autoRevealCommonLetters(self) -> None:
         """
         Automatically provide RSTLNE as 'used' letters (Futuristic Neural Bonus!).
         Reveals where present, disables buttons/ignores guesses always (no accidental penalties).
         """
-        for letter in AUTO_REVEAL_LETTERS:
-            self.used_letters.add(letter)
+        self._used_mask |= _AUTO_REVEAL_MASK
+        self._invalidate()
 
     def getMaskedWord(self) -> str:
         """
         Return a representation of the word with unguessed letters masked (e.g., '_ a _ g m a n').
+        The string is cached until the next guess, hint or reset.
         """
-        masked_characters = [
-            letter if letter in self.used_letters else "_"
-            for letter in self.secret_word
-        ]
-        return " ".join(masked_characters)
+        if self._masked_word is None:
+            # Unguessed letters (and any non a-z characters) translate to '_';
+            # guessed letters have no entry and pass through unchanged.
+            used_mask = self._used_mask
+            mask_table = {
+                ord(char): "_"
+                for char in self.secret_chars
+                if not used_mask & _LETTER_BITS.get(char, 0)
+            }
+            self._masked_word = " ".join(self.secret_word.translate(mask_table))
+        return self._masked_word
 
     def processGuess(self, letter: str) -> bool:
         """
@@ -70,22 +186,39 @@ class HangmanGame:
             True if the guess is correct (letter in secret_word),
             False if the guess is incorrect.
         """
-        letter = letter.lower()
+        return self.processGuessLower(letter.lower())
 
-        if not letter.isalpha() or len(letter) != 1:
+    def processGuessLower(self, letter: str) -> bool:
+        """
+        Process a guess that the caller has already lowercased.
+
+        Skips the per-call str.lower() allocation done by processGuess.
+
+        Args:
+            letter: A lowercase guess; anything other than a single a-z letter is rejected.
+
+        Returns:
+            True if the guess is correct, False if it is incorrect, invalid, or already used.
+        """
+        bit = _LETTER_BITS.get(letter)
+        if bit is None:
             # Invalid guess; in UI, you might show a message instead.
             return False
 
-        if letter in self.used_letters:
+        if self._used_mask & bit:
             # Letter already used; treat as no-op. UI can handle user feedback.
             return False
 
-        self.used_letters.add(letter)
+        self._used_mask |= bit
 
-        if letter not in self.secret_word:
-            self.wrong_guesses += 1
+        if not self._secret_mask & bit:
+            # A miss reveals nothing, so the cached mask and win state stay valid
+            self._wrong_guesses += 1
+            if self._wrong_guesses >= self._max_attempts:
+                self._is_lost = True
             return False
 
+        self._invalidate()
         return True
 
     def useHint(self) -> Optional[str]:
@@ -97,45 +230,126 @@ class HangmanGame:
             The revealed letter if successful, None if not enough attempts remaining
             or no letters left to reveal.
         """
-        remaining_attempts = self.max_attempts - self.wrong_guesses
+        remaining_attempts = self._max_attempts - self._wrong_guesses
         
         if remaining_attempts < HINT_COST:
             return None
 
-        # Find un-guessed letters in the secret word
-        unguessed = [
-            char for char in self.secret_word
-            if char not in self.used_letters and char.isalpha()
-        ]
+        # Un-guessed letters of the secret word, one bit each
+        remaining_mask = self._secret_mask & ~self._used_mask
 
-        if not unguessed:
+        if not remaining_mask:
             return None
 
-        # Pick one
-        letter_to_reveal = random.choice(unguessed)
-        
+        # Pick the n-th set bit uniformly: clear the n lowest bits, keep the next one
+        for _ in range(_randrange(remaining_mask.bit_count())):
+            remaining_mask &= remaining_mask - 1
+        bit_to_reveal = remaining_mask & -remaining_mask
+        letter_to_reveal = _BIT_LETTERS[bit_to_reveal.bit_length() - 1]
+
         # Add to used letters (it's a correct guess effectively)
-        self.used_letters.add(letter_to_reveal)
-        
+        self._used_mask |= bit_to_reveal
+        self._invalidate()
+
         # Apply penalty
-        self.wrong_guesses += HINT_COST
+        self._wrong_guesses += HINT_COST
+        if self._wrong_guesses >= self._max_attempts:
+            self._is_lost = True
         
         return letter_to_reveal
 
     def isWon(self) -> bool:
         """
         Check if the game is won (all letters guessed).
+        The result is cached until the next guess, hint or reset.
         """
-        return all(letter in self.used_letters for letter in self.secret_word)
+        if self._won_cached is None:
+            self._won_cached = (self._secret_mask & ~self._used_mask) == 0
+        return self._won_cached
 
     def isLost(self) -> bool:
         """
         Check if the game is lost (too many wrong guesses).
+        The flag is kept current wherever wrong_guesses or max_attempts change.
         """
-        return self.wrong_guesses >= self.max_attempts
+        return self._is_lost
 
     def isFinished(self) -> bool:
         """
         Check if the game is either won or lost.
+        Reads the maintained loss flag first, then the cached win check.
         """
-        return self.isWon() or self.isLost()
+        return self._is_lost or self.isWon()
+
+
+# Source for per-word subclasses built by makeSpecializedGameClass; {mask} and
+# {word} are filled in so the hot checks compare against literal constants.
+_SPECIALIZED_SOURCE = """
+class _SpecializedGame(HangmanGame):
+    __slots__ = ()
+
+    def __init__(self, secret_word, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        if secret_word.lower() != {word!r}:
+            raise ValueError("specialized game only plays " + {word!r})
+        HangmanGame.__init__(self, secret_word, max_attempts)
+
+    def resetGame(self, new_secret_word):
+        if new_secret_word.lower() != {word!r}:
+            raise ValueError("specialized game only plays " + {word!r})
+        HangmanGame.resetGame(self, new_secret_word)
+
+    def processGuessLower(self, letter):
+        bit = _LETTER_BITS.get(letter)
+        if bit is None:
+            return False
+        if self._used_mask & bit:
+            return False
+        self._used_mask |= bit
+        if not {mask} & bit:
+            self._wrong_guesses += 1
+            if self._wrong_guesses >= self._max_attempts:
+                self._is_lost = True
+            return False
+        self._invalidate()
+        return True
+
+    def isWon(self):
+        return ({mask} & ~self._used_mask) == 0
+"""
+
+# Upper bound on cached per-word classes; least recently used words are evicted
+# so long self-play runs over large vocabularies do not grow the cache forever.
+SPECIALIZED_CLASS_CACHE_SIZE: int = 1024
+
+
+def makeSpecializedGameClass(secret_word: str) -> Type[HangmanGame]:
+    """
+    Build (or fetch from cache) a HangmanGame subclass specialized for one word.
+
+    The subclass's processGuessLower and isWon are compiled with the word's letter
+    mask inlined as a constant, which trims attribute loads for simulations that
+    replay the same word many times. At most SPECIALIZED_CLASS_CACHE_SIZE classes
+    are kept; an evicted word is simply rebuilt on its next request.
+
+    Args:
+        secret_word: The word the class will play; case is ignored.
+
+    Returns:
+        A HangmanGame subclass. Instances must be created with (and reset to) this
+        word; any other word raises ValueError.
+    """
+    return _buildSpecializedGameClass(secret_word.lower())
+
+
+@lru_cache(maxsize=SPECIALIZED_CLASS_CACHE_SIZE)
+def _buildSpecializedGameClass(word: str) -> Type[HangmanGame]:
+    mask = 0
+    for char in word:
+        mask |= _LETTER_BITS.get(char, 0)
+    namespace = {
+        "HangmanGame": HangmanGame,
+        "DEFAULT_MAX_ATTEMPTS": DEFAULT_MAX_ATTEMPTS,
+        "_LETTER_BITS": _LETTER_BITS,
+    }
+    exec(_SPECIALIZED_SOURCE.format(mask=mask, word=word), namespace)
+    return namespace["_SpecializedGame"]
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+# hangman/gameLogicFast.py
+
+"""
+Batched Hangman self-play simulator for benchmarking and solver experiments.
+
+This module replays many Hangman rounds at once using the same 26-bit letter
+masks as gameLogic.HangmanGame. When the optional Numba dependency is installed
+the kernel is JIT-compiled (and parallelized across games); otherwise the same
+kernel runs as plain Python so results are identical either way.
+
+Author: @seanl
+Version: 1.1.0
+Creation Date: 10/15/2026
+Last Updated: 10/15/2026
+"""
+
+from typing import Any, Dict, List, Sequence
+
+from gameLogic import DEFAULT_MAX_ATTEMPTS, _AUTO_REVEAL_MASK, _BIT_LETTERS, _LETTER_BITS
+
+try:
+    import numba
+    import numpy as np
+except ImportError:  # Optional dependency; fall back to the pure-Python kernel.
+    numba = None
+    np = None
+
+NUMBA_AVAILABLE: bool = numba is not None
+
+OUTCOME_LOST: int = -1
+OUTCOME_UNFINISHED: int = 0
+OUTCOME_WON: int = 1
+
+# Shared with HangmanGame so the two implementations cannot drift apart
+AUTO_REVEAL_MASK: int = _AUTO_REVEAL_MASK
+_LETTER_INDEX: Dict[str, int] = {letter: index for index, letter in enumerate(_BIT_LETTERS)}
+
+prange = numba.prange if NUMBA_AVAILABLE else range
+
+
+def encodeSecretWord(secret_word: str) -> int:
+    """
+    Convert a secret word into its 26-bit letter mask.
+
+    Args:
+        secret_word: The word to encode; case is ignored and non a-z characters are skipped.
+
+    Returns:
+        An integer with bit i set when chr(ord('a') + i) appears in the word.
+    """
+    mask = 0
+    for char in secret_word.lower():
+        mask |= _LETTER_BITS.get(char, 0)
+    return mask
+
+
+def encodeGuessOrder(letters: str) -> List[int]:
+    """
+    Convert a guess sequence into letter indices (0 for 'a' ... 25 for 'z').
+
+    Args:
+        letters: The letters to guess, in order; non a-z characters are skipped.
+
+    Returns:
+        The list of letter indices.
+    """
+    return [_LETTER_INDEX[char] for char in letters.lower() if char in _LETTER_INDEX]
+
+
+def _simulateKernel(secret_masks: Any, guess_order: Any, max_attempts: int, outcomes: Any) -> None:
+    """
+    Play every game to completion, writing one outcome code per game into outcomes.
+
+    Negative entries in a guess_order row are treated as padding and skipped.
+    """
+    for game_index in prange(len(secret_masks)):
+        secret = secret_masks[game_index]
+        used = AUTO_REVEAL_MASK
+        wrong = 0
+        outcome = OUTCOME_UNFINISHED
+        if (secret & ~used) == 0:
+            outcome = OUTCOME_WON
+        elif max_attempts <= 0:
+            outcome = OUTCOME_LOST
+        else:
+            for letter_index in guess_order[game_index]:
+                if letter_index < 0:
+                    continue
+                bit = 1 << letter_index
+                if used & bit:
+                    continue
+                used |= bit
+                if not secret & bit:
+                    wrong += 1
+                    if wrong >= max_attempts:
+                        outcome = OUTCOME_LOST
+                        break
+                elif (secret & ~used) == 0:
+                    outcome = OUTCOME_WON
+                    break
+        outcomes[game_index] = outcome
+
+
+# Kept un-jitted so tests can check both kernels against HangmanGame
+_simulateKernelPython = _simulateKernel
+
+if NUMBA_AVAILABLE:
+    _simulateKernel = numba.njit(cache=True, parallel=True)(_simulateKernel)
+
+
+def simulateGames(
+    secret_masks: Sequence[int],
+    guess_order: Sequence[Sequence[int]],
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> Sequence[int]:
+    """
+    Simulate a batch of Hangman rounds, one guess sequence per secret word.
+
+    Args:
+        secret_masks: Secret words encoded with encodeSecretWord.
+        guess_order: One row of letter indices per game (see encodeGuessOrder);
+            rows may be padded with -1.
+        max_attempts: Wrong guesses allowed before a game is lost.
+
+    Returns:
+        One outcome per game: OUTCOME_WON, OUTCOME_LOST, or OUTCOME_UNFINISHED when
+        the guesses ran out first. A NumPy int32 array when Numba is available,
+        otherwise a list.
+    """
+    if len(secret_masks) != len(guess_order):
+        raise ValueError("secret_masks and guess_order must have the same length")
+
+    if NUMBA_AVAILABLE:
+        row_length = max((len(row) for row in guess_order), default=0)
+        guesses = np.full((len(guess_order), row_length), -1, dtype=np.int32)
+        for row_index, row in enumerate(guess_order):
+            guesses[row_index, :len(row)] = row
+        masks = np.asarray(secret_masks, dtype=np.int32)
+        outcomes = np.zeros(len(masks), dtype=np.int32)
+        _simulateKernel(masks, guesses, np.int32(max_attempts), outcomes)
+        return outcomes
+
+    outcomes_list = [OUTCOME_UNFINISHED] * len(secret_masks)
+    _simulateKernel(secret_masks, guess_order, max_attempts, outcomes_list)
+    return outcomes_list
@@ -8,17 +8,14 @@ tkinter for headless environments where system libraries might be missing.
 This code runs before any tests are collected, preventing ImportError.
 
 Author: @seanl
-Version: 1.1.0
+Version: 1.4.0
 Creation Date: 12/24/2025
-Last Updated: 12/25/2025
+Last Updated: 10/15/2026
 """
 
 import sys
 from unittest.mock import MagicMock
 
-# Create a mock module for tkinter
-mock_tk = MagicMock()
-
 # Ensure Tk and other widgets are classes that can be subclassed or instantiated
 # We use a custom MagicMock subclass for Tk that ensures children are just MagicMocks,
 # not instances of the subclass (like HangmanApp), to avoid recursion/init issues.
@@ -26,27 +23,54 @@ class SafeTkMock(MagicMock):
     def _get_child_mock(self, **kw):
         return MagicMock(**kw)
 
-mock_tk.Tk = SafeTkMock
-mock_tk.Frame = MagicMock
-mock_tk.Label = MagicMock
-mock_tk.Button = MagicMock
-mock_tk.Entry = MagicMock
-mock_tk.StringVar = MagicMock
-mock_tk.OptionMenu = MagicMock
-mock_tk.Canvas = MagicMock
-
-# Mock messagebox specifically
-mock_tk.messagebox = MagicMock()
-
-# Define constants used in the app
-mock_tk.NORMAL = 'normal'
-mock_tk.DISABLED = 'disabled'
-mock_tk.END = 'end'
-mock_tk.BOTH = 'both'
-mock_tk.X = 'x'
-mock_tk.LEFT = 'left'
-
-# Inject the mock into sys.modules to intercept imports
-sys.modules['tkinter'] = mock_tk
-sys.modules['_tkinter'] = MagicMock()
-sys.modules['tkinter.messagebox'] = mock_tk.messagebox
+
+def _buildTkMock() -> MagicMock:
+    """
+    Build the mock tkinter module tree used by every test.
+
+    Returns:
+        A MagicMock standing in for the tkinter package.
+    """
+    mock_tk = MagicMock()
+
+    mock_tk.Tk = SafeTkMock
+    mock_tk.Frame = MagicMock
+    mock_tk.Label = MagicMock
+    mock_tk.Button = MagicMock
+    mock_tk.Entry = MagicMock
+    mock_tk.StringVar = MagicMock
+    mock_tk.Canvas = MagicMock
+
+    # Mock messagebox and ttk specifically
+    mock_tk.messagebox = MagicMock()
+    mock_tk.ttk = MagicMock()
+
+    # Define constants used in the app
+    mock_tk.NORMAL = 'normal'
+    mock_tk.DISABLED = 'disabled'
+    mock_tk.HIDDEN = 'hidden'
+    mock_tk.ROUND = 'round'
+    mock_tk.CURRENT = 'current'
+    mock_tk.END = 'end'
+    mock_tk.BOTH = 'both'
+    mock_tk.X = 'x'
+    mock_tk.LEFT = 'left'
+
+    # A real exception class so `except tk.TclError` works against the mock
+    mock_tk.TclError = type("TclError", (Exception,), {})
+    return mock_tk
+
+
+# Build the mock once per interpreter; re-imports of this conftest (e.g. a second
+# rootdir or a plugin reloading it) reuse the tree already installed in sys.modules.
+if isinstance(sys.modules.get('tkinter'), MagicMock):
+    mock_tk = sys.modules['tkinter']
+else:
+    mock_tk = _buildTkMock()
+
+    # Inject the mock into sys.modules to intercept imports
+    sys.modules['tkinter'] = mock_tk
+    sys.modules['_tkinter'] = MagicMock()
+    sys.modules['tkinter.messagebox'] = mock_tk.messagebox
+    sys.modules['tkinter.ttk'] = mock_tk.ttk
+
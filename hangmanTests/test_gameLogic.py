@@ -8,15 +8,15 @@ This test suite covers the core game logic encapsulated in the HangmanGame
 class. It tests game state, guess processing, and win/loss conditions.
 
 Author: @seanl
-Version: 1.4.0
+Version: 1.6.2
 Creation Date: 11/20/2025
-Last Updated: 12/25/2025
+Last Updated: 10/15/2026
 """
 
 import unittest
 from unittest.mock import patch
 
-from gameLogic import HangmanGame, DEFAULT_MAX_ATTEMPTS, HINT_COST, AUTO_REVEAL_LETTERS
+from gameLogic import HangmanGame, DEFAULT_MAX_ATTEMPTS, HINT_COST, AUTO_REVEAL_LETTERS, makeSpecializedGameClass
 
 
 class TestHangmanGame(unittest.TestCase):
@@ -147,6 +147,39 @@ class TestHangmanGame(unittest.TestCase):
         game.processGuess("a")
         self.assertEqual(game.getMaskedWord(), "_ a n _ _ a n")
 
+    def testGetMaskedWordRefreshesAfterReset(self) -> None:
+        """
+        Verify the cached masked word is reused, rebuilt for a new word, and masks non-letters.
+        """
+        game = HangmanGame("jazz")
+        self.assertEqual(game.getMaskedWord(), "_ _ _ _")
+        self.assertIs(game.getMaskedWord(), game.getMaskedWord())
+        game.resetGame("ice age")
+        self.assertEqual(game.getMaskedWord(), "_ _ e _ _ _ e")
+        game.processGuess("a")
+        self.assertEqual(game.getMaskedWord(), "_ _ e _ a _ e")
+
+    def testMissKeepsCachedMaskedWord(self) -> None:
+        """
+        Verify a wrong guess reuses the cached masked word and a hit rebuilds it.
+        """
+        game = HangmanGame("jazz")
+        masked = game.getMaskedWord()
+        self.assertFalse(game.processGuess("q"))
+        self.assertIs(game.getMaskedWord(), masked)
+        self.assertTrue(game.processGuess("z"))
+        self.assertEqual(game.getMaskedWord(), "_ _ z z")
+
+    def testProcessGuessLowerFastPath(self) -> None:
+        """
+        Verify processGuessLower accepts lowercase input and rejects anything else.
+        """
+        game = HangmanGame("jazz")
+        self.assertTrue(game.processGuessLower("j"))
+        self.assertFalse(game.processGuessLower("A"))
+        self.assertEqual(game.wrong_guesses, 0)
+        self.assertTrue(game.processGuess("A"))
+
     def test_processGuess_invalid_input(self) -> None:
         """
         Verify that processGuess handles invalid (non-alphabetic, multi-char) input.
@@ -222,14 +255,25 @@ class TestHangmanGame(unittest.TestCase):
         Verify useHint reveals a letter and increments wrong_guesses.
         """
         game = HangmanGame("jazz") # No RSTLNE
-        # Mock random.choice to return 'j'
-        with patch('random.choice', return_value='j'):
+        # Unguessed bits in order are a, j, z; index 1 selects 'j'
+        with patch('gameLogic._randrange', return_value=1):
             revealed = game.useHint()
             
         self.assertEqual(revealed, 'j')
         self.assertIn('j', game.used_letters)
         self.assertEqual(game.wrong_guesses, HINT_COST)
 
+    def testUseHintCandidatesAreDistinctSecretLetters(self) -> None:
+        """
+        Verify useHint picks from each unguessed letter once, regardless of repeats.
+        """
+        game = HangmanGame("jazz")
+        with patch('gameLogic._randrange', return_value=2) as mock_randrange:
+            revealed = game.useHint()
+
+        mock_randrange.assert_called_once_with(3)
+        self.assertEqual(revealed, 'z')
+
     def testUseHintFailsIfNotEnoughLives(self) -> None:
         """
         Verify useHint returns None if remaining attempts < HINT_COST.
@@ -251,6 +295,123 @@ class TestHangmanGame(unittest.TestCase):
         revealed = self.game.useHint()
         self.assertIsNone(revealed)
 
+    def testUsedLettersMirrorsUsedMask(self) -> None:
+        """
+        Verify used_letters is materialized from the bitmask and can be assigned back.
+        """
+        game = HangmanGame("jazz")
+        game.processGuess("j")
+        self.assertTrue(game.used_mask & (1 << (ord("j") - 97)))
+        self.assertEqual(game.used_letters, AUTO_REVEAL_LETTERS | {"j"})
+
+        game.used_letters = {"J", "a", "z"}
+        self.assertEqual(game.used_letters, {"j", "a", "z"})
+        self.assertTrue(game.isWon())
+
+    def testUsedMaskIsReadOnly(self) -> None:
+        """
+        Verify the mask cannot be written directly, bypassing cache invalidation.
+        """
+        game = HangmanGame("jazz")
+        self.assertFalse(game.isWon())
+        with self.assertRaises(AttributeError):
+            game.used_mask = 0x3FFFFFF  # type: ignore[misc]
+        self.assertFalse(game.isWon())
+
+    def testIsWonCacheInvalidatedByGuessAndReset(self) -> None:
+        """
+        Verify the cached isWon result is refreshed after every state change.
+        """
+        game = HangmanGame("ab")
+        self.assertFalse(game.isWon())
+        game.processGuess("a")
+        self.assertFalse(game.isWon())
+        game.processGuess("b")
+        self.assertTrue(game.isWon())
+
+        game.resetGame("jazz")
+        self.assertFalse(game.isWon())
+        game.used_letters = {"j", "a", "z"}
+        self.assertTrue(game.isWon())
+
+    def testIsLostTracksDirectAssignments(self) -> None:
+        """
+        Verify the maintained loss flag follows wrong_guesses and max_attempts updates.
+        """
+        game = HangmanGame("jazz", max_attempts=2)
+        game.processGuess("b")
+        self.assertFalse(game.isLost())
+        game.processGuess("c")
+        self.assertTrue(game.isLost())
+
+        game.max_attempts = 3
+        self.assertFalse(game.isLost())
+        game.wrong_guesses = 3
+        self.assertTrue(game.isFinished())
+
+        game.resetGame("jazz")
+        self.assertFalse(game.isLost())
+
+    def testInstancesUseSlots(self) -> None:
+        """
+        Verify HangmanGame instances carry no per-instance __dict__.
+        """
+        self.assertFalse(hasattr(self.game, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.game.unexpected_attribute = 1
+
+    def testNonLetterGuessIsRejected(self) -> None:
+        """
+        Verify characters outside a-z never touch the bitmask.
+        """
+        game = HangmanGame("jazz")
+        initial_mask = game.used_mask
+        self.assertFalse(game.processGuess("é"))
+        self.assertFalse(game.processGuess("ab"))
+        self.assertEqual(game.used_mask, initial_mask)
+        self.assertEqual(game.wrong_guesses, 0)
+
+    def testSecretCharsComputedLazilyAndClearedOnReset(self) -> None:
+        """
+        Verify secret_chars is cached per word and recomputed after resetGame.
+        """
+        game = HangmanGame("Jazz")
+        self.assertEqual(game.secret_chars, frozenset("jaz"))
+        self.assertIs(game.secret_chars, game.secret_chars)
+
+        game.resetGame("hello")
+        self.assertEqual(game.secret_chars, frozenset("helo"))
+
+    def testSpecializedGameClassMatchesGenericGame(self) -> None:
+        """
+        Verify the per-word generated class is cached and plays like HangmanGame.
+        """
+        game_class = makeSpecializedGameClass("Jazz")
+        self.assertIs(game_class, makeSpecializedGameClass("jazz"))
+        self.assertTrue(issubclass(game_class, HangmanGame))
+
+        specialized = game_class("jazz", max_attempts=3)
+        generic = HangmanGame("jazz", max_attempts=3)
+        for letter in "qjxaz":
+            self.assertEqual(specialized.processGuess(letter), generic.processGuess(letter))
+            self.assertEqual(specialized.isWon(), generic.isWon())
+            self.assertEqual(specialized.getMaskedWord(), generic.getMaskedWord())
+        self.assertTrue(specialized.isWon())
+
+        specialized.resetGame("JAZZ")
+        self.assertFalse(specialized.isWon())
+        with self.assertRaises(ValueError):
+            specialized.resetGame("python")
+
+    def testSpecializedGameClassRejectsOtherWordOnConstruction(self) -> None:
+        """
+        Verify a specialized class refuses to be built with a different word.
+        """
+        game_class = makeSpecializedGameClass("cat")
+        with self.assertRaises(ValueError):
+            game_class("dog")
+        self.assertEqual(game_class("CAT").secret_word, "cat")
+
 
 if __name__ == "__main__":
     unittest.main()
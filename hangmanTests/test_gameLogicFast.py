@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# hangman/hangmanTests/test_gameLogicFast.py
+
+"""
+Unit tests for the batched self-play simulator.
+
+This test suite checks that gameLogicFast.simulateGames reaches the same
+win/loss outcomes as playing the same guesses through HangmanGame, both for
+the pure-Python kernel and for whichever kernel simulateGames dispatches to
+(Numba JIT when installed).
+
+Author: @seanl
+Version: 1.1.0
+Creation Date: 10/15/2026
+Last Updated: 10/15/2026
+"""
+
+import random
+import unittest
+
+from gameLogic import HangmanGame
+from gameLogicFast import (
+    AUTO_REVEAL_MASK,
+    OUTCOME_LOST,
+    OUTCOME_UNFINISHED,
+    OUTCOME_WON,
+    encodeGuessOrder,
+    encodeSecretWord,
+    simulateGames,
+    _simulateKernelPython,
+)
+from wordBank import WordBank
+
+
+def _playWithHangmanGame(secret_word: str, guesses: str, max_attempts: int) -> int:
+    """
+    Reference implementation: replay the guesses through HangmanGame.
+    """
+    game = HangmanGame(secret_word, max_attempts=max_attempts)
+    for letter in guesses:
+        if game.isFinished():
+            break
+        game.processGuess(letter)
+    if game.isWon():
+        return OUTCOME_WON
+    if game.isLost():
+        return OUTCOME_LOST
+    return OUTCOME_UNFINISHED
+
+
+class TestSimulateGames(unittest.TestCase):
+    """
+    Tests for the batched simulator.
+    """
+
+    def testEncodeSecretWord(self) -> None:
+        """
+        Ensure letters map to bits and non-letters are ignored.
+        """
+        self.assertEqual(encodeSecretWord("Ab a"), 0b11)
+        self.assertEqual(encodeGuessOrder("a-Z"), [0, 25])
+
+    def testOutcomesMatchHangmanGame(self) -> None:
+        """
+        Ensure each simulated outcome matches a HangmanGame replay.
+        """
+        scenarios = [
+            ("jazz", "jaz"),
+            ("jazz", "bcdfgh"),
+            ("python", "pyho"),
+            ("python", "pq"),
+            ("test", ""),
+            ("kangaroo", "kaqgo"),
+        ]
+        outcomes = simulateGames(
+            [encodeSecretWord(word) for word, _ in scenarios],
+            [encodeGuessOrder(guesses) for _, guesses in scenarios],
+        )
+        expected = [_playWithHangmanGame(word, guesses, 6) for word, guesses in scenarios]
+        self.assertEqual(list(outcomes), expected)
+        self.assertEqual(expected[:5], [OUTCOME_WON, OUTCOME_LOST, OUTCOME_WON, OUTCOME_UNFINISHED, OUTCOME_WON])
+
+    def testBothKernelsAgreeWithHangmanGame(self) -> None:
+        """
+        Ensure the pure-Python kernel and the dispatched kernel both match
+        HangmanGame on every built-in word with shuffled guess orders.
+        """
+        self.assertEqual(AUTO_REVEAL_MASK, HangmanGame("x").used_mask)
+        rng = random.Random(1234)
+        alphabet = "abcdefghijklmnopqrstuvwxyz"
+        word_bank = WordBank()
+        words = sorted({word for name in word_bank.getCategories() for word in word_bank.getWordsForCategory(name)})
+        guesses = ["".join(rng.sample(alphabet, rng.randint(0, 26))) for _ in words]
+
+        masks = [encodeSecretWord(word) for word in words]
+        orders = [encodeGuessOrder(order) for order in guesses]
+        expected = [_playWithHangmanGame(word, order, 6) for word, order in zip(words, guesses)]
+
+        python_outcomes = [OUTCOME_UNFINISHED] * len(words)
+        _simulateKernelPython(masks, orders, 6, python_outcomes)
+        self.assertEqual(python_outcomes, expected)
+        self.assertEqual(list(simulateGames(masks, orders)), expected)
+
+    def testZeroMaxAttemptsLosesUnlessAutoWon(self) -> None:
+        """
+        Ensure max_attempts=0 mirrors HangmanGame's immediate loss.
+        """
+        outcomes = simulateGames([encodeSecretWord("jazz"), encodeSecretWord("test")], [[], []], max_attempts=0)
+        self.assertEqual(list(outcomes), [OUTCOME_LOST, OUTCOME_WON])
+
+    def testMismatchedLengthsRaise(self) -> None:
+        """
+        Ensure a guess row is required for every game.
+        """
+        with self.assertRaises(ValueError):
+            simulateGames([encodeSecretWord("jazz")], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
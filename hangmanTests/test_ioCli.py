@@ -9,9 +9,9 @@ provides an optional command-line interface for the game. These tests ensure
 the game loop handles both win and loss conditions correctly.
 
 Author: @seanl
-Version: 2.1.0
+Version: 2.3.1
 Creation Date: 11/20/2025
-Last Updated: 12/25/2025
+Last Updated: 10/15/2026
 """
 
 from unittest.mock import patch, call
@@ -23,12 +23,20 @@ from wordBank import WordBank
 from gameLogic import HangmanGame
 
 
+@pytest.fixture(scope="session")
+def _shared_word_bank() -> WordBank:
+    """
+    Build the WordBank once per session; the CLI tests never mutate it.
+    """
+    return WordBank()
+
+
 @pytest.fixture
-def cli_dependencies():
+def cli_dependencies(_shared_word_bank):
     """
     Provides the necessary dependencies for instantiating HangmanCli.
     """
-    word_bank = WordBank()
+    word_bank = _shared_word_bank
     def game_factory(word: str) -> HangmanGame:
         return HangmanGame(word)
     return word_bank, game_factory
@@ -96,6 +104,22 @@ def testRunGameLoopLossCondition(cli_dependencies) -> None:
         assert secret_word in final_message
 
 
+def testRunGameLoopNormalizesInput(cli_dependencies) -> None:
+    """
+    Verify padded, uppercase input is lowercased before reaching the game.
+    """
+    word_bank, game_factory = cli_dependencies
+    cli = HangmanCli(word_bank=word_bank, game_factory=game_factory)
+    cli.game = game_factory("hi")
+
+    with patch('builtins.input', side_effect=[" H ", "I"]), \
+         patch('builtins.print') as mock_print:
+        cli.runGameLoop()
+
+    assert cli.game.wrong_guesses == 0
+    assert mock_print.call_args_list[-1] == call("You won! The word was: hi")
+
+
 def testRunGameLoopPrintsState(cli_dependencies) -> None:
     """
     Verify that the CLI prints the masked word and wrong guess count during the loop.
@@ -112,14 +136,45 @@ def testRunGameLoopPrintsState(cli_dependencies) -> None:
     with patch('builtins.input', side_effect=user_inputs), \
          patch('builtins.print') as mock_print:
         cli.runGameLoop()
-        
-        # Verify specific print calls occurred
-        # Initial state
-        assert call("\nWord:", "_") in mock_print.call_args_list
-        assert call("Wrong guesses: 0/6") in mock_print.call_args_list
-        
-        # After wrong guess 'z'
-        assert call("Wrong guesses: 1/6") in mock_print.call_args_list
-        
-        # Win message
-        assert call(f"You won! The word was: {secret_word}") in mock_print.call_args_list
+
+    # Collect the positional args of every print once so each check is a set lookup
+    # (mock.call objects themselves are unhashable).
+    printed = {print_call.args for print_call in mock_print.call_args_list}
+
+    # Verify specific print calls occurred
+    # Initial state
+    assert ("\nWord:", "_") in printed
+    assert ("Wrong guesses: 0/6",) in printed
+
+    # After wrong guess 'z'
+    assert ("Wrong guesses: 1/6",) in printed
+
+    # Win message
+    assert (f"You won! The word was: {secret_word}",) in printed
+
+
+@pytest.mark.benchmark
+def testRunGameLoopBenchmark(cli_dependencies, request) -> None:
+    """
+    Track runGameLoop throughput over a full 26-guess pangram round.
+    Deselected by the default (parallel) run; use `pytest -m benchmark -n0`.
+    Skipped when pytest-benchmark is not installed.
+    """
+    pytest.importorskip("pytest_benchmark")
+    benchmark = request.getfixturevalue("benchmark")
+    word_bank, game_factory = cli_dependencies
+    secret_word = "thequickbrownfoxjumpsoverthelazydog"
+    guesses = list("abcdefghijklmnopqrstuvwxyz")
+    cli = HangmanCli(word_bank=word_bank, game_factory=game_factory)
+
+    def playRound() -> HangmanGame:
+        cli.game = game_factory(secret_word)
+        with patch('builtins.input', side_effect=guesses), \
+             patch('builtins.print'):
+            cli.runGameLoop()
+        return cli.game
+
+    game = benchmark(playRound)
+
+    assert game.isWon()
+    assert game.wrong_guesses == 0
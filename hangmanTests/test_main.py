@@ -9,20 +9,26 @@ application. It focuses on verifying the correct setup and wiring of the
 game components, such as the game instance factory.
 
 Author: @seanl
-Version: 1.1.1
+Version: 1.3.0
 Creation Date: 11/20/2025
-Last Updated: 12/25/2025
+Last Updated: 10/15/2026
 """
 
 import unittest
-import runpy
 import sys
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+import uiTkinter
 from main import createGameInstance, main
 from gameLogic import HangmanGame
 from wordBank import WordBank
 
+# main.py compiled once at import; the __main__ test execs this code object
+# instead of having runpy re-read and re-compile the file on every run.
+_MAIN_PATH = Path(__file__).resolve().parent.parent / "main.py"
+_MAIN_CODE = compile(_MAIN_PATH.read_text(encoding="utf-8"), str(_MAIN_PATH), "exec")
+
 
 class TestMainModule(unittest.TestCase):
     """
@@ -64,25 +70,34 @@ class TestMainModule(unittest.TestCase):
     def testNameEqualsMainBlock(self) -> None:
         """
         Test that the if __name__ == "__main__": block calls main().
-        We use runpy to execute the module as a script.
+        We exec the precompiled main.py code object with __name__ set to "__main__".
         """
-        # We mock sys.argv to avoid side effects
-        with patch.object(sys, 'argv', ["main.py"]):
-            # We patch 'main.HangmanApp' to prevent the real UI from initializing
-            # and causing issues with the mocked tkinter environment during runpy execution.
-            # Since runpy re-imports the module, we need to patch it in a way that affects
-            # the execution. The easiest way is to patch the class in the module *before*
-            # runpy executes it, but runpy reloads.
-            
-            # Instead, we can patch 'uiTkinter.HangmanApp' because main.py imports it.
-            with patch('uiTkinter.HangmanApp') as mock_app_class:
-                try:
-                    runpy.run_path("main.py", run_name="__main__")
-                except SystemExit:
-                    pass
-                
-                # Verify that HangmanApp was instantiated, implying main() ran
-                mock_app_class.assert_called_once()
+        created_apps = []
+
+        class _RecordingApp:
+            def __init__(self, *args, **kwargs) -> None:
+                created_apps.append((args, kwargs))
+
+            def mainloop(self) -> None:
+                pass
+
+        # Swap sys.argv and uiTkinter.HangmanApp directly and restore them after.
+        # The exec'd code runs "from uiTkinter import HangmanApp" itself, so the
+        # class is replaced on uiTkinter rather than on the already-imported main.
+        original_argv = sys.argv
+        original_app_class = uiTkinter.HangmanApp
+        sys.argv = ["main.py"]
+        uiTkinter.HangmanApp = _RecordingApp
+        try:
+            exec(_MAIN_CODE, {"__name__": "__main__", "__file__": str(_MAIN_PATH)})
+        except SystemExit:
+            pass
+        finally:
+            sys.argv = original_argv
+            uiTkinter.HangmanApp = original_app_class
+
+        # Verify that HangmanApp was instantiated, implying main() ran
+        self.assertEqual(len(created_apps), 1)
 
 
 if __name__ == "__main__":
@@ -9,112 +9,275 @@ It uses extensive mocking to isolate the GUI logic from the Tkinter framework,
 allowing tests to run in a headless environment without a display.
 
 Author: @seanl
-Version: 2.9.0
+Version: 3.11.4
 Creation Date: 11/21/2025
-Last Updated: 12/25/2025
+Last Updated: 10/15/2026
 """
 
+import string
 import tkinter as tk
+from collections import Counter
 from contextlib import ExitStack
+from dataclasses import dataclass
 from types import SimpleNamespace
+from typing import Any
 from unittest.mock import MagicMock, patch, call
 
 import pytest
 
-from gameLogic import HangmanGame, HINT_COST
-from uiTkinter import DEFAULT_CATEGORY, HangmanApp
-from wordBank import WordBank
+import uiTkinter
+from gameLogic import AUTO_REVEAL_LETTERS, HangmanGame, HINT_COST
+from uiTkinter import BODY_PART_TAGS, DEFAULT_CATEGORY, HangmanApp
 
+# Widget state constants bound once for the assertions below
+_NORMAL = tk.NORMAL
+_DISABLED = tk.DISABLED
+_HIDDEN = tk.HIDDEN
 
-@pytest.fixture
-def hangmanApp():
-    with ExitStack() as stack:
-        # Since tkinter is mocked in conftest.py, we don't need to patch Tk.__init__
-        # to prevent the GUI from launching. The global mock handles it.
-        
-        mock_messagebox = stack.enter_context(patch('uiTkinter.messagebox'))
+# The per-action refresh helpers _refreshUiAfterAction fans out to
+_UPDATE_METHODS = (
+    '_updateWordLabel',
+    '_updateInfoLabel',
+    '_updateCanvas',
+    '_updateButtons',
+    '_updateHintButton',
+)
 
-        mock_option_menu = stack.enter_context(patch('tkinter.OptionMenu'))
-        mock_option_menu.return_value = MagicMock(name="OptionMenu")
 
-        mock_string_var = stack.enter_context(patch('tkinter.StringVar'))
-        category_var = MagicMock(name="StringVar")
-        mock_string_var.return_value = category_var
+def _resetGameMock(game: MagicMock) -> None:
+    """
+    Put the spec'd HangmanGame mock back into a fresh "test" round.
+    """
+    game.reset_mock(return_value=True, side_effect=True)
+    game.secret_word = "test"
+    game.max_attempts = 6
+    game.wrong_guesses = 0
+    # "test" contains 't', 'e', 's' which are all in RSTLNE, so the
+    # auto-revealed letters already uncover the whole word.
+    game.used_letters = set(AUTO_REVEAL_LETTERS)
+    game.getMaskedWord.return_value = "t e s t"
+    game.isWon.return_value = False
+    game.isLost.return_value = False
+    game.isFinished.return_value = False
+
+
+class _FakeWordBank:
+    """
+    Minimal WordBank stand-in that records the categories passed to getRandomWord.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.categories = ["general", "animals"]
+        self.random_word = "test"
+        self.random_word_calls = []
+
+    def getCategories(self):
+        return self.categories
 
-        # Mock Button creation. We need to capture the buttons created for the keyboard.
-        mock_button = stack.enter_context(patch('tkinter.Button'))
+    def getRandomWord(self, category_name=DEFAULT_CATEGORY):
+        self.random_word_calls.append(category_name)
+        return self.random_word
+
+
+class _MessageboxRecorder:
+    """
+    Stand-in for tkinter.messagebox that records (args, kwargs) per dialog kind.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls = {"showinfo": [], "showwarning": []}
+
+    def showinfo(self, *args, **kwargs):
+        self.calls["showinfo"].append((args, kwargs))
+
+    def showwarning(self, *args, **kwargs):
+        self.calls["showwarning"].append((args, kwargs))
+
+
+@dataclass(frozen=True, slots=True)
+class _TkWidgetBundle:
+    """
+    The shared app and the collaborators tests assert against.
+    """
+
+    app: Any
+    wordBank: _FakeWordBank
+    gameInstance: MagicMock
+    messagebox: _MessageboxRecorder
+    categoryVar: MagicMock
+    comboboxClass: MagicMock
+    categoryMenu: MagicMock
+    wordLabel: MagicMock
+    infoLabel: MagicMock
+    resetButton: Any
+    hintButton: Any
+    canvas: MagicMock
+    keyboardCanvas: MagicMock
+    mockButton: MagicMock
+
+    def resetAll(self) -> None:
+        """
+        Clear recorded calls on every collaborator; configured return values stay.
+        """
+        self.wordBank.random_word_calls.clear()
+        self.messagebox.reset()
+        for recorded in (self.gameInstance, self.categoryVar, self.categoryMenu, self.wordLabel, self.infoLabel,
+                         self.resetButton, self.hintButton, self.canvas, self.keyboardCanvas,
+                         self.mockButton):
+            recorded.reset_mock()
+
+
+@pytest.fixture(scope="module")
+def _hangmanAppModule():
+    """
+    Patch the widget classes and build one HangmanApp for the whole module.
+    """
+    with ExitStack() as stack:
+        # Since tkinter is mocked in conftest.py, we don't need to patch Tk.__init__
+        # to prevent the GUI from launching. The global mock handles it.
         
-        # We'll use a side_effect to return distinct mocks for each button creation
+        # Swap the module attribute directly; cheaper than a patch() round-trip
+        mock_messagebox = _MessageboxRecorder()
+        original_messagebox = uiTkinter.messagebox
+        uiTkinter.messagebox = mock_messagebox
+        stack.callback(setattr, uiTkinter, "messagebox", original_messagebox)
+
+        category_var = MagicMock()
+        category_menu = MagicMock(name="CategoryMenu")
+        combobox_class = MagicMock(return_value=category_menu)
+        canvas = MagicMock()
+        keyboard_canvas = MagicMock(name="KeyboardCanvas")
+
+        # Distinct button mocks per creation for the hint and reset buttons.
+        # Unnamed (the name only affects repr) and config is auto-created on access.
         def button_side_effect(*args, **kwargs):
-            btn = MagicMock(name="Button")
-            btn.config = MagicMock(name="Button.config")
-            return btn
-        
-        mock_button.side_effect = button_side_effect
+            return MagicMock()
+
+        mock_button = MagicMock(side_effect=button_side_effect)
 
-        mock_label = stack.enter_context(patch('tkinter.Label'))
         category_label = MagicMock(name="CategoryLabel")
-        title_label = MagicMock(name="TitleLabel")
-        subtitle_label = MagicMock(name="SubtitleLabel")
+        title_label = MagicMock()
+        subtitle_label = MagicMock()
         word_label = MagicMock(name="WordLabel")
         info_label = MagicMock(name="InfoLabel")
-        keyboard_title = MagicMock(name="KeyboardTitleLabel")
-        # Updated side_effect to include all labels (bonus_label removed)
-        mock_label.side_effect = [category_label, title_label, subtitle_label, word_label, info_label, keyboard_title]
+        keyboard_title = MagicMock()
 
-        mock_frame = stack.enter_context(patch('tkinter.Frame'))
         # Use a side_effect function for robust frame mocking
         def frame_side_effect(*args, **kwargs):
-            return MagicMock(name="Frame")
-        mock_frame.side_effect = frame_side_effect
-
-        mock_canvas = stack.enter_context(patch('tkinter.Canvas'))
-        canvas = MagicMock(name="Canvas")
-        mock_canvas.return_value = canvas
-
-        word_bank = MagicMock(spec=WordBank)
-        word_bank.getRandomWord.return_value = "test"
-        word_bank.getCategories.return_value = ["general", "animals"]
-
-        # Note: "test" contains 't', 'e', 's' which are all in RSTLNE.
-        # So used_letters will be populated on init.
-        game_instance = HangmanGame("test", max_attempts=6)
-        game_instance.isWon = MagicMock(return_value=False)
-        game_instance.isLost = MagicMock(return_value=False)
-        game_instance.processGuess = MagicMock(name="processGuess")
-        game_instance.useHint = MagicMock(name="useHint")
-        game_instance.isFinished = MagicMock(return_value=False)
+            return MagicMock()
+
+        # One patch.multiple installs the pre-built widget class mocks directly
+        stack.enter_context(patch.multiple(
+            'tkinter',
+            StringVar=MagicMock(return_value=category_var),
+            Button=mock_button,
+            # Updated side_effect to include all labels (bonus_label removed)
+            Label=MagicMock(side_effect=[category_label, title_label, subtitle_label, word_label, info_label, keyboard_title]),
+            Frame=MagicMock(side_effect=frame_side_effect),
+            # Created in order: scroll container, gallows, keyboard
+            Canvas=MagicMock(side_effect=[MagicMock(), canvas, keyboard_canvas]),
+        ))
+        stack.enter_context(patch.multiple('tkinter.ttk', Combobox=combobox_class, Style=MagicMock()))
+
+        word_bank = _FakeWordBank()
+
+        game_instance = MagicMock(spec=HangmanGame)
+        _resetGameMock(game_instance)
 
         app = HangmanApp(word_bank=word_bank, game_factory=lambda word: game_instance)
-        
-        # Manually inject attributes that might be expected by Tkinter internals or app code
-        app.tk = MagicMock(name="tk")
-        app.tk.call = MagicMock(name="tk.call")
-        app._w = "mocked_tk"
-        app.children = {}
+        # Run idle callbacks (the coalesced UI refresh) immediately so tests see
+        # their effects synchronously.
+        app.after_idle = MagicMock(side_effect=lambda callback, *args: callback(*args))
+        # HangmanApp subclasses conftest's SafeTkMock, so Tk internals (tk, _w,
+        # children) resolve to auto-created child mocks; nothing to inject.
 
-        yield SimpleNamespace(
+        yield _TkWidgetBundle(
             app=app,
             wordBank=word_bank,
             gameInstance=game_instance,
             messagebox=mock_messagebox,
             categoryVar=category_var,
+            comboboxClass=combobox_class,
+            categoryMenu=category_menu,
             wordLabel=word_label,
             infoLabel=info_label,
             resetButton=app.reset_button,
             hintButton=app.hint_button,
             canvas=canvas,
+            keyboardCanvas=keyboard_canvas,
             mockButton=mock_button
         )
 
 
+@pytest.fixture
+def hangmanApp(_hangmanAppModule):
+    """
+    Reset the module's shared HangmanApp to its freshly constructed state.
+    """
+    ns = _hangmanAppModule
+    app = ns.app
+
+    # Restore attributes individual tests swap out
+    app.game = ns.gameInstance
+    app.canvas = ns.canvas
+    app.keyboard_canvas = ns.keyboardCanvas
+    app.word_label = ns.wordLabel
+    app.info_label = ns.infoLabel
+    app.hint_button = ns.hintButton
+    app.category_var = ns.categoryVar
+    app.category_menu = ns.categoryMenu
+    app.current_category = DEFAULT_CATEGORY
+    app.score = 0
+    app._flush_scheduled = False
+    app._dirty = 0
+    app._pending_letter = None
+    app._last_masked = ""
+    app._last_info_key = None
+    app._last_hint_state = None
+    app._flash_after_id = None
+
+    _resetGameMock(ns.gameInstance)
+
+    ns.wordBank.reset()
+    ns.categoryVar.reset_mock(return_value=True, side_effect=True)
+    ns.resetAll()
+
+    # Replay the constructor's new-game pass so init-time calls are visible again
+    app._startNewGame()
+
+    yield ns
+
+    app.current_category = DEFAULT_CATEGORY
+
+
+@pytest.fixture
+def appPatches(hangmanApp, mocker):
+    """
+    Patch the app's new-game and UI refresh helpers in one place; pytest-mock
+    undoes them all at teardown.
+    """
+    app = hangmanApp.app
+    return SimpleNamespace(
+        startNewGame=mocker.patch.object(app, '_startNewGame'),
+        updates={name: mocker.patch.object(app, name) for name in _UPDATE_METHODS},
+    )
+
+
 def testInitSetsUpGameAndWidgets(hangmanApp) -> None:
     ns = hangmanApp
-    ns.wordBank.getRandomWord.assert_called_with(DEFAULT_CATEGORY)
+    assert ns.wordBank.random_word_calls[-1] == DEFAULT_CATEGORY
     assert ns.app.game is ns.gameInstance
     
-    # Verify 26 letter buttons + hint + reset
-    assert len(ns.app.letter_buttons) == 26
+    assert ns.app._categories == tuple(ns.wordBank.categories)
+
+    # Verify keyboard canvas + hint + reset
+    assert ns.app.keyboard_canvas is ns.keyboardCanvas
     assert ns.app.hint_button is not None
     assert ns.app.reset_button is not None
     
@@ -124,71 +287,135 @@ def testInitSetsUpGameAndWidgets(hangmanApp) -> None:
 
 def testStartNewGameRefreshesUiState(hangmanApp) -> None:
     ns = hangmanApp
-    ns.wordBank.getRandomWord.reset_mock()
-    ns.wordLabel.config.reset_mock()
-    ns.infoLabel.config.reset_mock()
-    ns.canvas.delete.reset_mock()
-    ns.hintButton.config.reset_mock()
+    # Snapshot counts instead of resetting; the fixture's own _startNewGame
+    # replay has already recorded calls on these mocks.
+    words_before = len(ns.wordBank.random_word_calls)
+    word_configs_before = ns.wordLabel.config.call_count
+    info_configs_before = ns.infoLabel.config.call_count
 
     ns.app.current_category = "animals"
-    ns.wordBank.getRandomWord.return_value = "kangaroo"
+    ns.wordBank.random_word = "kangaroo"
 
     ns.app._startNewGame()
 
-    ns.wordBank.getRandomWord.assert_called_once_with("animals")
-    assert ns.wordLabel.config.call_count >= 1
-    assert ns.infoLabel.config.call_count == 1
-    ns.canvas.delete.assert_called_with("all")
-    ns.hintButton.config.assert_called_with(state=tk.NORMAL)
+    assert ns.wordBank.random_word_calls[words_before:] == ["animals"]
+    # Colour and masked word go out in a single config call
+    assert ns.wordLabel.config.call_count - word_configs_before == 1
+    ns.wordLabel.config.assert_called_with(fg="#00ff41", text="t e s t")
+    assert ns.infoLabel.config.call_count - info_configs_before == 1
+    ns.canvas.itemconfigure.assert_called_with("right_leg", state=_HIDDEN)
+    ns.hintButton.config.assert_called_with(state=_NORMAL)
 
 
-def testOnCategoryChangedUpdatesStateAndRestarts(hangmanApp) -> None:
+def testOnCategoryChangedUpdatesStateAndRestarts(hangmanApp, appPatches) -> None:
     ns = hangmanApp
-    ns.categoryVar.get.return_value = "animals"
-
-    with patch.object(ns.app, '_startNewGame') as mock_start:
-        ns.app._onCategoryChanged("animals")
-        assert ns.app.current_category == "animals"
-        mock_start.assert_called_once_with()
+    ns.app._onCategoryChanged("animals")
+    assert ns.app.current_category == "animals"
+    appPatches.startNewGame.assert_called_once_with()
+    # The callback argument is used directly; the StringVar is never read back
+    ns.categoryVar.get.assert_not_called()
 
 
 def testUpdateLabelsRefreshesWordAndInfo(hangmanApp) -> None:
     ns = hangmanApp
-    with patch.object(ns.app.game, 'getMaskedWord', return_value="t _ _ t"):
-        ns.app.game.used_letters = {"t"}
-        ns.app.game.wrong_guesses = 0
-        ns.app._updateWordLabel()
-        ns.app._updateInfoLabel()
+    # The game is a MagicMock reset by the fixture, so plain assignment suffices
+    ns.app.game.getMaskedWord.return_value = "t _ _ t"
+    ns.app.game.used_letters = {"t"}
+    ns.app.game.wrong_guesses = 0
+    ns.app._updateWordLabel()
+    ns.app._updateInfoLabel()
 
     assert ns.wordLabel.config.call_args_list[-1] == call(text="t _ _ t")
     # Updated for futuristic UI text
     assert "◉ ENERGY: 6/6" in ns.infoLabel.config.call_args_list[-1][1]['text']
 
 
-def testOnGuessHandlesInputAndUpdatesUi(hangmanApp) -> None:
+def testUpdateLabelsSkipUnchangedText(hangmanApp) -> None:
+    ns = hangmanApp
+    ns.app._updateWordLabel()
+    ns.app._updateInfoLabel()
+    word_configs = ns.wordLabel.config.call_count
+    info_configs = ns.infoLabel.config.call_count
+
+    # Nothing changed since the fixture's new-game pass
+    ns.app._updateWordLabel()
+    ns.app._updateInfoLabel()
+    assert ns.wordLabel.config.call_count == word_configs
+    assert ns.infoLabel.config.call_count == info_configs
+
+    ns.gameInstance.wrong_guesses = 1
+    ns.app._updateInfoLabel()
+    assert ns.infoLabel.config.call_count == info_configs + 1
+
+
+def testUpdateBonusLabelUsesPrecomputedText(hangmanApp, monkeypatch) -> None:
+    ns = hangmanApp
+    bonus_label = MagicMock()
+    monkeypatch.setattr(ns.app, "bonus_label", bonus_label)
+
+    ns.app._updateBonusLabel()
+
+    bonus_label.config.assert_called_once_with(text=uiTkinter._BONUS_TEXT)
+    assert " ".join(sorted(AUTO_REVEAL_LETTERS)).upper() in uiTkinter._BONUS_TEXT
+
+
+@pytest.mark.parametrize(
+    "was_correct, expected_updates",
+    [
+        (True, {'_updateWordLabel', '_updateButtons'}),
+        (False, {'_updateInfoLabel', '_updateCanvas', '_updateButtons', '_updateHintButton'}),
+    ],
+    ids=["hit", "miss"],
+)
+def testOnGuessHandlesInputAndUpdatesUi(hangmanApp, appPatches, was_correct, expected_updates) -> None:
     ns = hangmanApp
     ns.gameInstance.processGuess.reset_mock()
+    ns.gameInstance.processGuess.return_value = was_correct
+
+    # Use 'Z' because 'E' is in RSTLNE and is auto-revealed in "test"
+    ns.app._onGuess("Z")
+
+    assert ns.gameInstance.processGuess.call_count == 1
+    assert ns.gameInstance.processGuess.call_args.args == ("Z",)
+    called = {name for name, update in appPatches.updates.items() if update.called}
+    assert called == expected_updates
+    appPatches.updates['_updateButtons'].assert_called_once_with("Z")
+
+
+def testWrongGuessFlashesBackdropItem(hangmanApp) -> None:
+    ns = hangmanApp
+    ns.gameInstance.processGuess.return_value = False
+    ns.app.after.reset_mock()
+
+    ns.app._onGuess("Z")
+
+    ns.canvas.itemconfigure.assert_any_call(ns.app._bg_rect, fill="#2a0000")
+    ns.canvas.configure.assert_not_called()
+
+    ns.app.after.assert_called_once_with(150, ns.app._clearFlash)
+    ns.app._clearFlash()
+    ns.canvas.itemconfigure.assert_called_with(ns.app._bg_rect, fill=ns.app.canvas_bg)
+    assert ns.app._flash_after_id is None
 
-    with patch.object(ns.app, '_updateWordLabel') as mock_update_word, \
-         patch.object(ns.app, '_updateInfoLabel') as mock_update_info, \
-         patch.object(ns.app, '_updateCanvas') as mock_update_canvas, \
-         patch.object(ns.app, '_updateButtons') as mock_update_buttons, \
-         patch.object(ns.app, '_updateHintButton') as mock_update_hint:
-        
-        # Use 'Z' because 'E' is in RSTLNE and is auto-revealed in "test"
-        ns.app._onGuess("Z")
 
-    ns.gameInstance.processGuess.assert_called_once_with("Z")
-    mock_update_word.assert_called_once_with()
-    mock_update_info.assert_called_once_with()
-    mock_update_canvas.assert_called_once_with()
-    mock_update_buttons.assert_called_once_with()
-    mock_update_hint.assert_called_once_with()
+def testRapidMissesRestartFlashTimer(hangmanApp, monkeypatch) -> None:
+    ns = hangmanApp
+    ns.gameInstance.processGuess.return_value = False
+    monkeypatch.setattr(ns.app, "after", MagicMock(side_effect=["flash-1", "flash-2"]))
+    monkeypatch.setattr(ns.app, "after_cancel", MagicMock())
+
+    ns.app._onGuess("Z")
+    ns.app._onGuess("Q")
+
+    ns.app.after_cancel.assert_called_once_with("flash-1")
+    assert ns.app._flash_after_id == "flash-2"
 
 
 def testOnGuessIgnoresUsedLetters(hangmanApp) -> None:
     ns = hangmanApp
     ns.gameInstance.used_letters = {"z"}
+    # The app snapshots the game's used letters when a game starts
+    ns.app._startNewGame()
     ns.gameInstance.processGuess.reset_mock()
 
     ns.app._onGuess("Z")
@@ -196,6 +423,48 @@ def testOnGuessIgnoresUsedLetters(hangmanApp) -> None:
     ns.gameInstance.processGuess.assert_not_called()
 
 
+def testOnGuessTreatsLowerCaseRepeatAsDuplicate(hangmanApp, monkeypatch) -> None:
+    """
+    A repeat in lower case is caught by the duplicate check instead of going
+    down the miss path (bell, flash, miss refresh).
+    """
+    ns = hangmanApp
+    ns.gameInstance.processGuess.return_value = True
+    ns.app._onGuess("q")
+    assert "Q" in ns.app._used_upper
+
+    ns.gameInstance.processGuess.reset_mock()
+    bell = MagicMock()
+    monkeypatch.setattr(ns.app, "bell", bell)
+    ns.app._onGuess("q")
+
+    ns.gameInstance.processGuess.assert_not_called()
+    bell.assert_not_called()
+
+
+def testOnGuessRecordsLetterWithoutReadingGameUsedLetters(hangmanApp) -> None:
+    ns = hangmanApp
+    ns.gameInstance.processGuess.return_value = True
+
+    ns.app._onGuess("Q")
+    ns.app._onGuess("Q")
+
+    ns.gameInstance.processGuess.assert_called_once_with("Q")
+    assert "Q" in ns.app._used_upper
+
+
+def testHintRecordsRevealedLetter(hangmanApp) -> None:
+    ns = hangmanApp
+    ns.gameInstance.useHint.return_value = "u"
+    ns.keyboardCanvas.reset_mock()
+
+    ns.app._onHintButtonClicked()
+
+    assert "U" in ns.app._used_upper
+    # Only the newly revealed key is greyed; the auto-revealed ones already are
+    ns.keyboardCanvas.itemconfigure.assert_called_once_with("key_U", state=_DISABLED)
+
+
 def testOnGuessIgnoresFinishedGame(hangmanApp) -> None:
     ns = hangmanApp
     ns.gameInstance.isFinished.return_value = True
@@ -206,101 +475,325 @@ def testOnGuessIgnoresFinishedGame(hangmanApp) -> None:
     ns.gameInstance.processGuess.assert_not_called()
 
 
-def testOnGuessHandlesWinAndLoss(hangmanApp) -> None:
+@pytest.mark.parametrize(
+    "won, lost, letter, expected_title, expected_word_config",
+    [
+        # Letters 'A' and 'B' are not in RSTLNE, so they are still guessable
+        (True, False, "A", "◉ DECRYPTION SUCCESS!", call(fg="#00ff41")),
+        (False, True, "B", "◉ SYSTEM BREACH DETECTED", call(text="TEST", fg="#ff0000")),
+    ],
+    ids=["win", "loss"],
+)
+def testOnGuessHandlesWinAndLoss(
+    hangmanApp, won, lost, letter, expected_title, expected_word_config
+) -> None:
     ns = hangmanApp
-    ns.messagebox.showinfo.reset_mock()
-    
-    # Test Win
-    ns.gameInstance.isWon.return_value = True
-    ns.gameInstance.isLost.return_value = False
-    # Use 'A' (not in RSTLNE)
-    ns.app._onGuess("A")
+    ns.gameInstance.isWon.return_value = won
+    ns.gameInstance.isLost.return_value = lost
+    ns.app.after.reset_mock()
+
+    ns.app._onGuess(letter)
+
+    # The result dialog is deferred to the event loop, not shown inline
+    assert ns.messagebox.calls["showinfo"] == []
+    deferred = [c.args[1] for c in ns.app.after.call_args_list if c.args[0] == 0]
+    assert len(deferred) == 1
+    deferred[0]()
 
     # Updated for futuristic UI text
-    args, _ = ns.messagebox.showinfo.call_args
-    assert "◉ DECRYPTION SUCCESS!" in args[0]
-    ns.app.letter_buttons['A'].config.assert_called_with(state=tk.DISABLED)
-    ns.wordLabel.config.assert_called_with(fg="#00ff41")
-
-    # Reset for Loss test
-    ns.messagebox.showinfo.reset_mock()
-    ns.gameInstance.isWon.return_value = False
+    args, _ = ns.messagebox.calls["showinfo"][-1]
+    assert expected_title in args[0]
+    ns.keyboardCanvas.itemconfigure.assert_called_with("key", state=_DISABLED)
+    assert ns.wordLabel.config.call_args == expected_word_config
+
+
+def testRefreshUiAfterActionCoalescesPendingRefreshes(hangmanApp, appPatches, monkeypatch) -> None:
+    ns = hangmanApp
+    # Hold the idle callback instead of running it; monkeypatch restores it
+    monkeypatch.setattr(ns.app.after_idle, "side_effect", None)
+    ns.app.after_idle.reset_mock()
+
+    ns.app._refreshUiAfterAction("A")
+    ns.app._refreshUiAfterAction("A")
+    ns.app._refreshUiAfterAction("B")
+
+    ns.app.after_idle.assert_called_once_with(ns.app._flushUi)
+    for update in appPatches.updates.values():
+        update.assert_not_called()
+
+    ns.app._flushUi()
+
+    for name, update in appPatches.updates.items():
+        assert update.call_count == 1, name
+    # Mixed letters in one batch refresh every used key
+    appPatches.updates['_updateButtons'].assert_called_once_with(None)
+    assert ns.app._flush_scheduled is False
+    assert ns.app._dirty == 0
+
+
+def testStartNewGameSettlesPendingFlushOfFinishedGame(hangmanApp, monkeypatch) -> None:
+    """
+    A winning guess whose refresh is still queued when a new game starts is
+    settled first, and the stale idle callback does nothing afterwards.
+    """
+    ns = hangmanApp
+    monkeypatch.setattr(ns.app.after_idle, "side_effect", None)
+    handle_win = MagicMock()
+    monkeypatch.setattr(ns.app, "_handleWin", handle_win)
+    ns.gameInstance.processGuess.return_value = True
+    ns.gameInstance.isWon.return_value = True
+
+    ns.app._onGuess("Q")
+    handle_win.assert_not_called()
+
+    ns.app._startNewGame()
+    handle_win.assert_called_once_with()
+    assert ns.app._flush_scheduled is False
+    assert ns.app._dirty == 0
+
+    # The idle callback queued by the guess now finds nothing to flush
+    ns.app._flushUi()
+    handle_win.assert_called_once_with()
+
+
+def testStaleGuessLetterDoesNotGreyKeyInNewGame(hangmanApp, monkeypatch) -> None:
+    """
+    A letter queued by the previous game is neither greyed out nor recorded as
+    disabled once a new game has reset the keyboard.
+    """
+    ns = hangmanApp
+    monkeypatch.setattr(ns.app.after_idle, "side_effect", None)
+    ns.gameInstance.processGuess.return_value = False
+
+    ns.app._onGuess("Q")
+    ns.app._startNewGame()
+    ns.app._flushUi()
+
+    assert ns.app._pending_letter is None
+    assert "Q" not in ns.app._disabled_keys
+    assert ns.keyboardCanvas.itemconfigure.call_args_list[-1].args != ("key_Q",)
+
+    # Directly asking for an unused letter is ignored as well
+    ns.keyboardCanvas.reset_mock()
+    ns.app._updateButtons("Q")
+    ns.keyboardCanvas.itemconfigure.assert_not_called()
+
+
+def testLossRedrawsCanvasOnce(hangmanApp, appPatches) -> None:
+    ns = hangmanApp
+    ns.gameInstance.processGuess.return_value = False
     ns.gameInstance.isLost.return_value = True
-    
-    # Use 'B' (not in RSTLNE)
+
     ns.app._onGuess("B")
 
-    # Updated for futuristic UI text
-    args, _ = ns.messagebox.showinfo.call_args
-    assert "◉ SYSTEM BREACH DETECTED" in args[0]
-    ns.app.letter_buttons['B'].config.assert_called_with(state=tk.DISABLED)
+    assert appPatches.updates['_updateCanvas'].call_count == 1
 
 
 def testUpdateButtonsDisablesUsedLetters(hangmanApp) -> None:
     ns = hangmanApp
-    ns.gameInstance.used_letters = {"a", "z"}
-    
+    ns.app._used_upper.update({"A", "Z"})
+    ns.keyboardCanvas.reset_mock()
+
     ns.app._updateButtons()
 
-    ns.app.letter_buttons['A'].config.assert_called_with(state=tk.DISABLED, bg="#333366", fg="#6666ff")
-    ns.app.letter_buttons['Z'].config.assert_called_with(state=tk.DISABLED, bg="#333366", fg="#6666ff")
-    ns.app.letter_buttons['B'].config.assert_called_with(state=tk.NORMAL, bg="#00ffff", fg="#000000")
+    # Keys already greyed (the auto-revealed letters) and unused keys are left alone
+    configured = {(c.args, c.kwargs["state"]) for c in ns.keyboardCanvas.itemconfigure.call_args_list}
+    assert configured == {(("key_A",), _DISABLED), (("key_Z",), _DISABLED)}
 
 
-def testPhysicalKeyBinding(hangmanApp) -> None:
+def testUpdateButtonsWithLetterTouchesOnlyThatKey(hangmanApp) -> None:
+    ns = hangmanApp
+    ns.app._used_upper.update({"A", "Z"})
+    ns.keyboardCanvas.reset_mock()
+
+    ns.app._updateButtons("A")
+
+    ns.keyboardCanvas.itemconfigure.assert_called_once_with("key_A", state=_DISABLED)
+
+
+def testStartNewGameResetsKeyboardByTag(hangmanApp) -> None:
+    ns = hangmanApp
+    ns.keyboardCanvas.reset_mock()
+
+    ns.app._startNewGame()
+
+    calls = ns.keyboardCanvas.itemconfigure.call_args_list
+    assert calls[0] == call("key", state=_NORMAL)
+    assert sorted(calls[1:], key=str) == sorted(
+        (call(f"key_{letter.upper()}", state=_DISABLED) for letter in AUTO_REVEAL_LETTERS), key=str
+    )
+
+
+def testBuildKeyboardDrawsTaggedKeys(hangmanApp, monkeypatch) -> None:
+    ns = hangmanApp
+    ns.keyboardCanvas.reset_mock()
+    monkeypatch.setattr(tk, "Canvas", MagicMock(return_value=ns.keyboardCanvas))
+
+    ns.app._buildKeyboard(MagicMock())
+
+    for create in (ns.keyboardCanvas.create_rectangle, ns.keyboardCanvas.create_text):
+        tags = {kwargs["tags"] for _, kwargs in create.call_args_list}
+        assert tags == {("key", f"key_{letter}") for letter in string.ascii_uppercase}
+    ns.keyboardCanvas.tag_bind.assert_called_once_with("key", "<Button-1>", ns.app._onKeyCanvasClick)
+
+
+@pytest.mark.parametrize(
+    "tags, expected",
+    [
+        (("key", "key_Q", "current"), "Q"),
+        (("current",), None),
+    ],
+    ids=["key", "background"],
+)
+def testKeyCanvasClickGuessesKeyUnderPointer(hangmanApp, tags, expected) -> None:
+    ns = hangmanApp
+    ns.keyboardCanvas.gettags.return_value = tags
+
+    with patch.object(ns.app, '_onGuess') as mock_guess:
+        ns.app._onKeyCanvasClick(MagicMock())
+
+    ns.keyboardCanvas.gettags.assert_called_once_with("current")
+    if expected is None:
+        mock_guess.assert_not_called()
+    else:
+        mock_guess.assert_called_once_with(expected)
+
+
+@pytest.mark.parametrize(
+    "char, expected",
+    [("k", "K"), ("K", "K"), ("", None), ("1", None), ("é", None)],
+)
+def testPhysicalKeyBinding(hangmanApp, char, expected) -> None:
     ns = hangmanApp
     event = MagicMock()
-    event.char = "k"
-    
+    event.char = char
+
     with patch.object(ns.app, '_onGuess') as mock_guess:
         ns.app._onPhysicalKey(event)
-        mock_guess.assert_called_once_with("K")
 
+    if expected is None:
+        mock_guess.assert_not_called()
+    else:
+        mock_guess.assert_called_once_with(expected)
+
+
+@pytest.mark.parametrize(
+    "req_widths, expect_update",
+    [([700], False), ([1, 700], True)],
+    ids=["laid-out", "unsized"],
+)
+def testAutosizeForcesLayoutOnlyWhenUnsized(hangmanApp, monkeypatch, req_widths, expect_update) -> None:
+    app = hangmanApp.app
+    for name, value in (("winfo_exists", MagicMock(return_value=True)),
+                        ("winfo_reqwidth", MagicMock(side_effect=req_widths)),
+                        ("winfo_reqheight", MagicMock(return_value=900)),
+                        ("winfo_screenwidth", MagicMock(return_value=1920)),
+                        ("winfo_screenheight", MagicMock(return_value=1080)),
+                        ("update_idletasks", MagicMock()),
+                        ("geometry", MagicMock())):
+        monkeypatch.setattr(app, name, value)
+
+    app._autosizeWindowToContent()
+
+    assert app.update_idletasks.called is expect_update
+    app.geometry.assert_called_once_with("740x940")
+
+
+def testPhysicalKeysBoundPerLetter(hangmanApp) -> None:
+    ns = hangmanApp
+
+    bound = {
+        bind_call.args[0]
+        for bind_call in ns.app.bind.call_args_list
+        if bind_call.args[1] == ns.app._onPhysicalKey
+    }
+
+    assert bound == {f"<KeyPress-{key}>" for key in string.ascii_letters}
+
+
+def testMouseWheelBoundOnlyWhilePointerOverScrollArea(hangmanApp) -> None:
+    ns = hangmanApp
+    app = ns.app
+    handlers = {c.args[0]: c.args[1] for c in app.scroll_canvas.bind.call_args_list}
+    app.bind_all.reset_mock()
+    app.unbind_all.reset_mock()
+
+    handlers["<Enter>"](MagicMock())
+    wheel = {c.args[0]: c.args[1] for c in app.bind_all.call_args_list}
+    assert set(wheel) == {"<MouseWheel>", "<Button-4>", "<Button-5>"}
+
+    wheel["<MouseWheel>"](SimpleNamespace(delta=-120))
+    wheel["<Button-4>"](SimpleNamespace(num=4))
+    assert app.scroll_canvas.yview_scroll.call_args_list[-2:] == [call(1, "units"), call(-1, "units")]
+
+    # Moving onto a child of the scroll canvas keeps the wheel bound
+    app.winfo_containing.return_value = f"{app.scroll_canvas}.!frame"
+    handlers["<Leave>"](MagicMock())
+    app.unbind_all.assert_not_called()
 
-def testUpdateCanvasDrawsAllBodyParts(hangmanApp) -> None:
+    app.winfo_containing.return_value = None
+    handlers["<Leave>"](MagicMock())
+    assert {c.args[0] for c in app.unbind_all.call_args_list} == set(wheel)
+
+
+@pytest.mark.parametrize("wrong_guesses", [0, 2, 6])
+def testUpdateCanvasTogglesBodyParts(hangmanApp, monkeypatch, wrong_guesses) -> None:
     """
-    Test that _updateCanvas draws all body parts for 6 wrong guesses.
+    Test that _updateCanvas shows one tagged part per wrong guess without redrawing.
     """
     ns = hangmanApp
-    ns.canvas.delete.reset_mock()
-    ns.canvas.create_line.reset_mock()
-    ns.canvas.create_oval.reset_mock()
 
-    # Simulate 6 wrong guesses
-    ns.app.game.wrong_guesses = 6
+    # Plain recording callables instead of MagicMock call recording; monkeypatch
+    # restores the shared canvas mock's methods after the test.
+    drawn = Counter()
+    states = {}
+    monkeypatch.setattr(ns.canvas, "create_line", lambda *args, **kwargs: drawn.update(("line",)))
+    monkeypatch.setattr(ns.canvas, "create_oval", lambda *args, **kwargs: drawn.update(("oval",)))
+    monkeypatch.setattr(ns.canvas, "itemconfigure", lambda tag, **kwargs: states.__setitem__(tag, kwargs["state"]))
+
+    ns.app.game.wrong_guesses = wrong_guesses
+    ns.app._last_wrong_drawn = -1
     ns.app._updateCanvas()
 
-    # Should clear canvas
-    ns.canvas.delete.assert_called_with("all")
+    assert not drawn
+    assert states == {
+        tag: _NORMAL if stage <= wrong_guesses else _HIDDEN
+        for stage, tag in enumerate(BODY_PART_TAGS, start=1)
+    }
+
+
+def testUpdateCanvasSkipsUnchangedWrongCount(hangmanApp) -> None:
+    ns = hangmanApp
+    ns.canvas.itemconfigure.reset_mock()
+
+    # The fixture's new-game pass already drew the zero-miss state
+    ns.app._updateCanvas()
+    ns.canvas.itemconfigure.assert_not_called()
 
-    # Gallows: 4 lines (pillar, beam, rope, body) + 4 limbs = 8 lines
-    # Rectangle is drawn with create_rectangle, not create_line
-    assert ns.canvas.create_line.call_count == 8
-    # Ovals: energy node + 2 head + 2 neural nodes + core reactor + 2 arm endpoints + 2 leg endpoints = 9
-    assert ns.canvas.create_oval.call_count == 9
-    assert ns.canvas.create_oval.called
+    ns.gameInstance.wrong_guesses = 1
+    ns.app._updateCanvas()
+    assert ns.canvas.itemconfigure.call_count == len(BODY_PART_TAGS)
 
 
-def testUpdateCanvasHandlesNone(hangmanApp) -> None:
+def testBuildCanvasItemsCreatesPartsHidden(hangmanApp) -> None:
     """
-    Test defensive check: _updateCanvas should not crash if game or canvas is None.
+    Test that body parts are created once, hidden, under their BODY_PART_TAGS tag.
     """
     ns = hangmanApp
-    
-    # Case 1: game is None
-    ns.app.game = None
-    ns.canvas.delete.reset_mock()
-    ns.app._updateCanvas()
-    ns.canvas.delete.assert_not_called()
-    
-    # Case 2: canvas is None
-    ns.app.game = ns.gameInstance
-    ns.app.canvas = None
-    ns.app._updateCanvas()
-    # No crash expected
-    
-    # Restore canvas
-    ns.app.canvas = ns.canvas
+    ns.resetAll()
+
+    ns.app._buildCanvasItems()
+
+    part_calls = [
+        kwargs
+        for create in (ns.canvas.create_line, ns.canvas.create_oval,
+                       ns.canvas.create_rectangle, ns.canvas.create_text)
+        for _, kwargs in create.call_args_list
+        if "tags" in kwargs
+    ]
+    assert {kwargs["tags"] for kwargs in part_calls} == set(BODY_PART_TAGS)
+    assert all(kwargs["state"] == _HIDDEN for kwargs in part_calls)
+
 
 def testHintButtonCallsUseHint(hangmanApp) -> None:
     """
@@ -314,7 +807,7 @@ def testHintButtonCallsUseHint(hangmanApp) -> None:
         
         ns.gameInstance.useHint.assert_called_once()
         # Updated for futuristic UI text
-        args, _ = ns.messagebox.showinfo.call_args
+        args, _ = ns.messagebox.calls["showinfo"][-1]
         assert "◉ QUANTUM SCAN COMPLETE" in args[0]
         mock_refresh.assert_called_once()
 
@@ -328,7 +821,7 @@ def testHintButtonShowsWarningIfFailed(hangmanApp) -> None:
     ns.app._onHintButtonClicked()
     
     # Updated for futuristic UI text
-    args, _ = ns.messagebox.showwarning.call_args
+    args, _ = ns.messagebox.calls["showwarning"][-1]
     assert "Quantum Hint Unavailable" in args[0]
 
 def testUpdateHintButtonDisablesIfLowLives(hangmanApp) -> None:
@@ -342,7 +835,7 @@ def testUpdateHintButtonDisablesIfLowLives(hangmanApp) -> None:
     
     ns.app._updateHintButton()
     
-    ns.hintButton.config.assert_called_with(state=tk.DISABLED)
+    ns.hintButton.config.assert_called_with(state=_DISABLED)
 
 def testUpdateHintButtonEnablesIfEnoughLives(hangmanApp) -> None:
     """
@@ -355,50 +848,120 @@ def testUpdateHintButtonEnablesIfEnoughLives(hangmanApp) -> None:
     
     ns.app._updateHintButton()
     
-    ns.hintButton.config.assert_called_with(state=tk.NORMAL)
+    ns.hintButton.config.assert_called_with(state=_NORMAL)
+
+def testUpdateHintButtonSkipsUnchangedState(hangmanApp) -> None:
+    """
+    Test that the hint button is only reconfigured when its state changes.
+    """
+    ns = hangmanApp
+    ns.hintButton.config.reset_mock()
+
+    ns.app._updateHintButton()
+    ns.hintButton.config.assert_not_called()
 
-def testOnResetButtonClicked(hangmanApp) -> None:
+    ns.app._disableInput()
+    ns.app._updateHintButton()
+    assert ns.hintButton.config.call_args_list == [call(state=_DISABLED), call(state=_NORMAL)]
+
+def testOnResetButtonClicked(hangmanApp, appPatches) -> None:
     """
     Test that clicking the reset button calls _startNewGame.
     """
     ns = hangmanApp
-    with patch.object(ns.app, '_startNewGame') as mock_start:
-        ns.app._onResetButtonClicked()
-        mock_start.assert_called_once()
+    ns.app._onResetButtonClicked()
+    appPatches.startNewGame.assert_called_once()
+
+@pytest.mark.parametrize(
+    "attr, method, args, watched",
+    [
+        ("game", "_updateWordLabel", (), "wordLabel.config"),
+        ("word_label", "_updateWordLabel", (), "gameInstance.getMaskedWord"),
+        ("game", "_updateInfoLabel", (), "infoLabel.config"),
+        ("info_label", "_updateInfoLabel", (), None),
+        ("game", "_onGuess", ("A",), "gameInstance.processGuess"),
+        ("game", "_onHintButtonClicked", (), "gameInstance.useHint"),
+        ("game", "_refreshUiAfterAction", (), "app.after_idle"),
+        ("game", "_flushUi", (), "wordLabel.config"),
+        ("game", "_updateButtons", (), "keyboardCanvas.itemconfigure"),
+        ("game", "_resetKeyboard", (), "keyboardCanvas.itemconfigure"),
+        ("keyboard_canvas", "_updateButtons", (), None),
+        ("keyboard_canvas", "_onKeyCanvasClick", (None,), None),
+        ("game", "_updateHintButton", (), "hintButton.config"),
+        ("hint_button", "_updateHintButton", (), None),
+        ("game", "_updateCanvas", (), "canvas.itemconfigure"),
+        ("canvas", "_updateCanvas", (), None),
+        ("canvas", "_clearFlash", (), None),
+    ],
+)
+def testDefensiveNoneChecks(hangmanApp, attr, method, args, watched) -> None:
+    """
+    Test that methods guarding on a None game or widget return without side effects.
+    """
+    ns = hangmanApp
+    watched_mock = None
+    if watched is not None:
+        watched_mock = ns
+        for name in watched.split("."):
+            watched_mock = getattr(watched_mock, name)
+        watched_mock.reset_mock()
+
+    setattr(ns.app, attr, None)
+
+    # Should not raise
+    getattr(ns.app, method)(*args)
+
+    if watched_mock is not None:
+        watched_mock.assert_not_called()
 
-def testDefensiveChecksForNoneGame(hangmanApp) -> None:
+def testCategoryMenuIsReadonlyComboboxOfAllCategories(hangmanApp) -> None:
     """
-    Test that methods with `if self.game is None: return` are covered.
+    The category picker is one readonly Combobox fed the cached category tuple.
     """
     ns = hangmanApp
-    
-    # Reset mocks to clear any calls from fixture setup
-    ns.infoLabel.config.reset_mock()
-    ns.gameInstance.processGuess.reset_mock()
-    ns.gameInstance.useHint.reset_mock()
+    assert ns.app.category_menu is ns.categoryMenu
+    kwargs = ns.comboboxClass.call_args.kwargs
+    assert kwargs["values"] is ns.app._categories
+    assert kwargs["state"] == "readonly"
+    assert kwargs["textvariable"] is ns.categoryVar
 
-    ns.app.game = None
-    
-    # These methods should not raise an error
-    ns.app._updateInfoLabel()
-    ns.app._onGuess("A")
-    ns.app._onHintButtonClicked()
-    ns.app._refreshUiAfterAction()
-    ns.app._updateButtons()
-    ns.app._updateHintButton()
-    
-    # Verify no downstream calls were made
-    ns.infoLabel.config.assert_not_called()
-    ns.gameInstance.processGuess.assert_not_called()
-    ns.gameInstance.useHint.assert_not_called()
-    
-def testOnCategoryChangedWithStrArgument(hangmanApp) -> None:
+
+def testOnCategoryChangedReadsComboboxSelection(hangmanApp, appPatches) -> None:
+    """
+    A <<ComboboxSelected>> event reads the choice back from the StringVar.
+    """
+    ns = hangmanApp
+    ns.categoryVar.get.return_value = "space"
+    ns.app._onCategoryChanged(MagicMock(name="ComboboxSelectedEvent"))
+    assert ns.app.current_category == "space"
+    ns.categoryMenu.selection_clear.assert_called_once_with()
+    appPatches.startNewGame.assert_called_once_with()
+
+
+def testOnCategoryChangedWithStrArgument(hangmanApp, appPatches) -> None:
     """
     Test _onCategoryChanged when the argument is a plain string.
     """
     ns = hangmanApp
     ns.app.category_var = None # Simulate case where it's not set
-    with patch.object(ns.app, '_startNewGame') as mock_start:
-        ns.app._onCategoryChanged("new_category")
-        assert ns.app.current_category == "new_category"
-        mock_start.assert_called_once()
+    ns.app._onCategoryChanged("new_category")
+    assert ns.app.current_category == "new_category"
+    appPatches.startNewGame.assert_called_once()
+
+
+def testRunAsyncPumpsTkEventsUntilWindowCloses(hangmanApp, monkeypatch) -> None:
+    """
+    runAsync keeps calling update() between asyncio sleeps and returns once Tk
+    reports the window is gone.
+    """
+    ns = hangmanApp
+    pumps = []
+
+    def fakeUpdate() -> None:
+        pumps.append(len(pumps))
+        if len(pumps) == 3:
+            raise tk.TclError("application has been destroyed")
+
+    monkeypatch.setattr(ns.app, "update", fakeUpdate)
+    ns.app.runAsync(frame_interval=0)
+    assert len(pumps) == 3
@@ -9,11 +9,12 @@ it correctly manages word categories, retrieves words, and provides random words
 for the game.
 
 Author: @seanl
-Version: 1.2.0
+Version: 1.8.1
 Creation Date: 11/20/2025
-Last Updated: 12/25/2025
+Last Updated: 10/15/2026
 """
 
+import sys
 import unittest
 
 from wordBank import WordBank, DEFAULT_CATEGORY
@@ -24,8 +25,12 @@ class TestWordBank(unittest.TestCase):
     Basic tests for WordBank behavior.
     """
 
-    def setUp(self) -> None:
-        self.word_bank = WordBank()
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Built once for the class; its category table is the shared read-only one.
+        cls.word_bank = WordBank()
+        # Tiny bank for behavior tests that don't depend on the built-in word lists
+        cls.small_bank = WordBank(categories={DEFAULT_CATEGORY: ["cat", "dog"]})
 
     def testDefaultCategoriesExist(self) -> None:
         """
@@ -36,37 +41,95 @@ class TestWordBank(unittest.TestCase):
         self.assertIn("movies", categories)
         self.assertIn("science", categories)
 
+    def testGetCategoriesReturnsSharedTuple(self) -> None:
+        """
+        Ensure getCategories hands back the same cached tuple on every call.
+        """
+        categories = self.small_bank.getCategories()
+        self.assertEqual(categories, (DEFAULT_CATEGORY,))
+        self.assertIs(self.small_bank.getCategories(), categories)
+
     def testGetWordsForValidCategory(self) -> None:
         """
         Ensure we can retrieve words for a known category.
         """
-        words = self.word_bank.getWordsForCategory(DEFAULT_CATEGORY)
+        words = self.small_bank.getWordsForCategory(DEFAULT_CATEGORY)
         self.assertIsInstance(words, list)
-        self.assertGreater(len(words), 0)
+        self.assertEqual(words, ["cat", "dog"])
+
+    def testDefaultWordListsAreFrozenTuples(self) -> None:
+        """
+        Ensure the built-in bank stores tuples under interned category names.
+        """
+        for name, words in self.word_bank.categories.items():
+            self.assertIsInstance(words, tuple)
+            self.assertIs(name, sys.intern(name))
+        self.assertIn(DEFAULT_CATEGORY, self.word_bank.categories)
+
+    def testDefaultBanksShareReadOnlyCategoryTable(self) -> None:
+        """
+        Ensure default banks share one read-only category table.
+        """
+        other = WordBank()
+        self.assertIs(other.categories, self.word_bank.categories)
+        with self.assertRaises(TypeError):
+            other.categories["extra"] = ("word",)  # type: ignore[index]
+
+    def testGetWordsForUnknownCategoryFallsBackToDefault(self) -> None:
+        """
+        Ensure an unknown category falls back to DEFAULT_CATEGORY's words.
+        """
+        self.assertEqual(self.small_bank.getWordsForCategory("no such sector"), ["cat", "dog"])
 
     def testGetRandomWordReturnsString(self) -> None:
         """
         Ensure getRandomWord returns a non-empty string.
         """
-        word = self.word_bank.getRandomWord(DEFAULT_CATEGORY)
+        word = self.small_bank.getRandomWord(DEFAULT_CATEGORY)
         self.assertIsInstance(word, str)
-        self.assertGreater(len(word), 0)
+        self.assertIn(word, ("cat", "dog"))
+
+    def testGetRandomWordFallsBackToDefaultCategory(self) -> None:
+        """
+        Ensure an unknown category draws from DEFAULT_CATEGORY.
+        """
+        self.assertIn(self.small_bank.getRandomWord("no such sector"), ("cat", "dog"))
+
+    def testGetRandomWordDealsEveryWordBeforeRepeating(self) -> None:
+        """
+        Ensure a category's words are all dealt once before any repeats, and a
+        refill never hands back the word just dealt.
+        """
+        words = ("ant", "bee", "cow", "doe")
+        bank = WordBank(categories={DEFAULT_CATEGORY: list(words)})
+        previous = None
+        for _ in range(25):
+            dealt = [bank.getRandomWord() for _ in words]
+            self.assertEqual(sorted(dealt), list(words))
+            self.assertNotEqual(dealt[0], previous)
+            previous = dealt[-1]
 
     def testGetRandomWordRaisesErrorForEmptyCategory(self) -> None:
         """
         Ensure getRandomWord raises ValueError for an empty category.
         """
-        # Create a category with an empty list explicitly
+        # The built-in table is read-only, so use a bank with an explicitly empty category
         empty_category = "empty_test_category"
-        self.word_bank.categories[empty_category] = []
-        
-        # Verify that accessing this category raises ValueError
-        # This should hit line 55: raise ValueError(...)
+        bank = WordBank(categories={DEFAULT_CATEGORY: ["cat"], empty_category: []})
         with self.assertRaises(ValueError) as cm:
-            self.word_bank.getRandomWord(empty_category)
-        
+            bank.getRandomWord(empty_category)
+
         self.assertIn(f"No words available for category '{empty_category}'", str(cm.exception))
 
+    def testGetRandomWordErrorNamesRequestedCategory(self) -> None:
+        """
+        Ensure an unknown category with no default words is named in the error.
+        """
+        bank = WordBank(categories={DEFAULT_CATEGORY: []})
+        with self.assertRaises(ValueError) as cm:
+            bank.getRandomWord("no such sector")
+        self.assertIn("'no such sector'", str(cm.exception))
+
     def testGetWordsForNonExistentCategoryReturnsDefault(self) -> None:
         """
         Ensure requesting a non-existent category falls back to default.
@@ -9,9 +9,9 @@ It is not wired into the main application by default, which uses a graphical use
 interface (GUI), but can be used for manual testing or as an alternative front-end.
 
 Author: @seanl
-Version: 1.0.0
+Version: 1.0.1
 Creation Date: 11/20/2025
-Last Updated: 11/20/2025
+Last Updated: 10/15/2026
 """
 
 from typing import Callable
@@ -40,8 +40,8 @@ class HangmanCli:
         while not self.game.isFinished():
             print("\nWord:", self.game.getMaskedWord())
             print(f"Wrong guesses: {self.game.wrong_guesses}/{self.game.max_attempts}")
-            guess = input("Guess a letter: ").strip()
-            self.game.processGuess(guess)
+            guess = input("Guess a letter: ").strip().lower()
+            self.game.processGuessLower(guess)
 
         if self.game.isWon():
             print(f"You won! The word was: {self.game.secret_word}")
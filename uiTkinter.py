@@ -8,18 +8,123 @@ This module provides the HangmanApp class, a cyberpunk-themed graphical user
 interface for the Hangman game. Neon glows, neural bonuses, score tracking.
 
 Author: @seanl
-Version: 1.6.0
+Version: 1.17.4
 Creation Date: 11/20/2025
-Last Updated: 12/25/2025
+Last Updated: 10/15/2026
 """
 
+import asyncio
+import string
 import tkinter as tk
-from tkinter import messagebox
-from typing import Callable, Optional, Any, Dict
+from functools import partial
+from tkinter import messagebox, ttk
+from typing import Callable, Optional, Any, Dict, Set, Tuple
 
 from gameLogic import HangmanGame, HINT_COST, AUTO_REVEAL_LETTERS
 from wordBank import WordBank, DEFAULT_CATEGORY
 
+# Canvas tag per body part, in the order wrong guesses reveal them
+BODY_PART_TAGS: Tuple[str, ...] = ("head", "body", "left_arm", "right_arm", "left_leg", "right_leg")
+
+# Static gallows items as (kind, coords, options), drawn once and never touched
+_GALLOWS_SPECS: Tuple[Tuple[str, Tuple[int, ...], Dict[str, Any]], ...] = (
+    # Base platform
+    ("rectangle", (50, 255, 170, 265), {"fill": "#0a0a1f", "outline": "#00ffff", "width": 2}),
+    # Main pillar
+    ("line", (110, 255, 110, 50), {"fill": "#00ffff", "width": 6, "capstyle": tk.ROUND}),
+    # Support beam
+    ("line", (110, 50, 170, 50), {"fill": "#00ffff", "width": 5, "capstyle": tk.ROUND}),
+    # Energy node
+    ("oval", (165, 45, 175, 55), {"fill": "#6666ff", "outline": "#3333ff", "width": 2}),
+    # Plasma rope
+    ("line", (170, 55, 170, 85), {"fill": "#ff3366", "width": 4, "capstyle": tk.ROUND, "dash": (5, 2)}),
+)
+
+# Body-part items as (tag, item kind, coords, options), drawn once in
+# _buildCanvasItems; several items can share a tag and appear together
+_PART_SPECS: Tuple[Tuple[str, str, Tuple[int, ...], Dict[str, Any]], ...] = (
+    # Head - Neural interface
+    ("head", "oval", (155, 85, 185, 115), {"outline": "#00ffff", "width": 4}),
+    ("head", "oval", (160, 90, 180, 110), {"outline": "#6666ff", "width": 2, "fill": "#000511"}),
+    # Neural nodes
+    ("head", "oval", (165, 95, 170, 100), {"fill": "#00ffff", "outline": "#00ffff"}),
+    ("head", "oval", (170, 95, 175, 100), {"fill": "#00ffff", "outline": "#00ffff"}),
+    # Body - Energy core
+    ("body", "line", (170, 110, 170, 190), {"fill": "#00ffff", "width": 5}),
+    # Core reactor
+    ("body", "rectangle", (165, 145, 175, 155), {"fill": "#6666ff", "outline": "#9999ff", "width": 2}),
+    # Left Arm - Plasma conduit
+    ("left_arm", "line", (170, 130, 150, 160), {"fill": "#ff3366", "width": 4}),
+    ("left_arm", "oval", (148, 158, 152, 162), {"fill": "#ff3366", "outline": "#ff3366"}),
+    # Right Arm - Plasma conduit
+    ("right_arm", "line", (170, 130, 190, 160), {"fill": "#ff3366", "width": 4}),
+    ("right_arm", "oval", (188, 158, 192, 162), {"fill": "#ff3366", "outline": "#ff3366"}),
+    # Left Leg - Quantum stabilizer
+    ("left_leg", "line", (170, 190, 150, 220), {"fill": "#6666ff", "width": 4}),
+    ("left_leg", "oval", (148, 218, 152, 222), {"fill": "#00ffff", "outline": "#00ffff"}),
+    # Right Leg - Quantum stabilizer
+    ("right_leg", "line", (170, 190, 190, 220), {"fill": "#6666ff", "width": 4}),
+    ("right_leg", "oval", (188, 218, 192, 222), {"fill": "#00ffff", "outline": "#00ffff"}),
+    # System overload effect
+    ("right_leg", "text", (110, 280), {"text": "⚠ SYSTEM OVERLOAD ⚠", "fill": "#ff3366", "font": ("Consolas", 10, "bold")}),
+)
+
+# Canvas keyboard: every key's rectangle and label carry "key" plus a per-letter
+# tag. Disabled colours are baked into the items, so enabling or disabling a
+# key is a single state change on its tag.
+_KEY_RECT_STYLE: Dict[str, Any] = {
+    "fill": "#00ffff",
+    "outline": "#00ffff",
+    "disabledfill": "#333366",
+    "disabledoutline": "#6666ff",
+}
+_KEY_FONT: Tuple[str, int, str] = ("Consolas", 11, "bold")
+_KEY_TEXT_STYLE: Dict[str, Any] = {
+    "font": _KEY_FONT,
+    "fill": "#000000",
+    "disabledfill": "#6666ff",
+}
+# Keyboard layout: rows, key size and spacing, and the canvas size they imply
+_KEY_ROWS: Tuple[str, ...] = ("QWERTYUIOP", "ASDFGHJKL", "ZXCVBNM")
+_KEY_WIDTH, _KEY_HEIGHT, _KEY_GAP = 54, 40, 6
+_KEY_ROW_PITCH: int = _KEY_HEIGHT + _KEY_GAP * 3
+_KEYBOARD_WIDTH: int = len(_KEY_ROWS[0]) * (_KEY_WIDTH + _KEY_GAP) + _KEY_GAP
+_KEYBOARD_HEIGHT: int = len(_KEY_ROWS) * _KEY_ROW_PITCH + _KEY_GAP
+# Upper-case letter -> its key tag, and the reverse for click hit-testing
+_KEY_TAGS: Dict[str, str] = {char: f"key_{char}" for char in string.ascii_uppercase}
+_KEY_TAG_LETTERS: Dict[str, str] = {f"key_{char}": char for char in string.ascii_uppercase}
+# Physical key character -> the upper-case letter to guess; anything else is ignored
+_KEYMAP: Dict[str, str] = {char: char.upper() for char in string.ascii_letters}
+
+# Widget styles shared by the control buttons, built once at import
+_CONTROL_BUTTON_STYLE: Dict[str, Any] = {
+    "font": ("Consolas", 10, "bold"),
+    "activeforeground": "#000000",
+    "relief": "solid",
+    "bd": 1,
+    "highlightthickness": 2,
+    "padx": 20,
+    "pady": 8,
+}
+
+# Dirty-flag bits for the UI parts a refresh can touch; see HangmanApp._flushUi.
+# A correct guess leaves the attempt count (info, canvas, hint) alone, a wrong one the word.
+_DIRTY_WORD = 1
+_DIRTY_INFO = 2
+_DIRTY_CANVAS = 4
+_DIRTY_KEYS = 8
+_DIRTY_HINT = 16
+_DIRTY_ALL = _DIRTY_WORD | _DIRTY_INFO | _DIRTY_CANVAS | _DIRTY_KEYS | _DIRTY_HINT
+_DIRTY_HIT = _DIRTY_WORD | _DIRTY_KEYS
+_DIRTY_MISS = _DIRTY_INFO | _DIRTY_CANVAS | _DIRTY_KEYS | _DIRTY_HINT
+
+# AUTO_REVEAL_LETTERS and HINT_COST never change, so these labels are formatted once
+_BONUS_TEXT: str = f"◉ NEURAL BONUS MATRIX: {' '.join(sorted(AUTO_REVEAL_LETTERS)).upper()} ACTIVATED"
+_HINT_BUTTON_TEXT: str = f"◉ NEURAL SCAN [-{HINT_COST} ENERGY]"
+
+# Seconds between Tk event pumps when runAsync drives the window (~120 Hz)
+_ASYNC_FRAME_INTERVAL: float = 1 / 120
+
 
 class HangmanApp(tk.Tk):
     """
@@ -50,16 +155,39 @@ class HangmanApp(tk.Tk):
         self.canvas_bg: str = "#000511"
 
         self.canvas: Optional[tk.Canvas] = None
+        self._bg_rect: Optional[int] = None
+        self._flash_after_id: Optional[str] = None
+        # wrong_guesses count the body parts currently reflect; -1 forces a pass
+        self._last_wrong_drawn: int = -1
         self.word_label: Optional[tk.Label] = None
         self.info_label: Optional[tk.Label] = None
         self.bonus_label: Optional[tk.Label] = None
         self.reset_button: Optional[tk.Button] = None
         self.hint_button: Optional[tk.Button] = None
         self.category_var: Optional[tk.StringVar] = None
-        self.category_menu: Optional[tk.OptionMenu] = None
+        self.category_menu: Optional[ttk.Combobox] = None
+        # The word bank's categories are fixed for the app's lifetime
+        self._categories: Tuple[str, ...] = tuple(word_bank.getCategories())
         
-        # Virtual Keyboard
-        self.letter_buttons: Dict[str, tk.Button] = {}
+        # Virtual Keyboard, drawn as items on one canvas
+        self.keyboard_canvas: Optional[tk.Canvas] = None
+
+        # Last state pushed to the word/info labels and hint button; unchanged
+        # values skip config. The info key is (remaining, max, category, score).
+        self._last_masked: str = ""
+        self._last_info_key: Optional[Tuple[int, int, str, int]] = None
+        self._last_hint_state: Optional[str] = None
+
+        # Upper-case letters used this game, and those whose keys are already
+        # greyed out; kept here so guesses and key updates skip game.used_letters,
+        # which is rebuilt from the game's bitmask on every access
+        self._used_upper: Set[str] = set()
+        self._disabled_keys: Set[str] = set()
+
+        # Coalesced refresh state; see _refreshUiAfterAction
+        self._dirty: int = 0
+        self._flush_scheduled: bool = False
+        self._pending_letter: Optional[str] = None
 
         self._setupUserInterface()
         self._startNewGame()
@@ -89,11 +217,30 @@ class HangmanApp(tk.Tk):
         self.scroll_canvas.bind("<Configure>", _on_canvas_configure)
 
         def _on_mousewheel(event: tk.Event) -> None:  # type: ignore[name-defined]
-            if not hasattr(event, "delta"):
-                return
             self.scroll_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
 
-        self.scroll_canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        def _on_wheel_button(event: tk.Event) -> None:  # type: ignore[name-defined]
+            # X11 reports the wheel as buttons 4 (up) and 5 (down)
+            self.scroll_canvas.yview_scroll(-1 if event.num == 4 else 1, "units")
+
+        # Wheel handlers are only installed while the pointer is over the scroll
+        # area, so wheel events elsewhere never reach Python
+        def _on_scroll_enter(event: tk.Event) -> None:  # type: ignore[name-defined]
+            self.bind_all("<MouseWheel>", _on_mousewheel)
+            self.bind_all("<Button-4>", _on_wheel_button)
+            self.bind_all("<Button-5>", _on_wheel_button)
+
+        def _on_scroll_leave(event: tk.Event) -> None:  # type: ignore[name-defined]
+            # Crossing into an embedded child also fires <Leave>; stay bound
+            # while the pointer is still inside the scroll area
+            inside = self.winfo_containing(event.x_root, event.y_root)
+            if inside is not None and str(inside).startswith(str(self.scroll_canvas)):
+                return
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                self.unbind_all(sequence)
+
+        self.scroll_canvas.bind("<Enter>", _on_scroll_enter)
+        self.scroll_canvas.bind("<Leave>", _on_scroll_leave)
 
         main_frame = tk.Frame(scroll_root, bg="#000000", padx=40, pady=20)
         main_frame.pack(fill="both", expand=True)
@@ -137,23 +284,31 @@ class HangmanApp(tk.Tk):
         category_label.pack(side="left")
 
         self.category_var = tk.StringVar(value=self.current_category)
-        categories = self.word_bank.getCategories()
-        self.category_menu = tk.OptionMenu(
-            category_frame,
-            self.category_var,
-            *categories,
-            command=self._onCategoryChanged,
+        # A readonly Combobox takes every name as one Tcl list, rather than a
+        # menu entry per category as tk.OptionMenu builds
+        combo_style = ttk.Style(self)
+        combo_style.configure(
+            "Sector.TCombobox",
+            foreground="#000000",
+            background="#00ffff",
+            arrowcolor="#000000",
+            bordercolor="#00ffff",
         )
-        self.category_menu.configure(
-            font=("Consolas", 10, "bold"), 
-            fg="#000000", 
-            bg="#00ffff", 
-            activebackground="#66ffff", 
-            activeforeground="#000000",
-            relief="solid",
-            bd=1,
-            highlightthickness=0
+        combo_style.map(
+            "Sector.TCombobox",
+            fieldbackground=[("readonly", "#00ffff")],
+            background=[("active", "#66ffff")],
         )
+        self.category_menu = ttk.Combobox(
+            category_frame,
+            textvariable=self.category_var,
+            values=self._categories,
+            state="readonly",
+            style="Sector.TCombobox",
+            font=("Consolas", 10, "bold"),
+            width=max(map(len, self._categories), default=0) + 1,
+        )
+        self.category_menu.bind("<<ComboboxSelected>>", self._onCategoryChanged)
         self.category_menu.pack(side="right", padx=(5, 0))
 
         # Holographic Display Canvas
@@ -162,6 +317,7 @@ class HangmanApp(tk.Tk):
         
         self.canvas = tk.Canvas(canvas_frame, width=240, height=300, bg=self.canvas_bg, highlightthickness=0)
         self.canvas.pack(padx=10, pady=10)
+        self._buildCanvasItems()
 
         # Decryption Display
         self.word_label = tk.Label(
@@ -197,44 +353,12 @@ class HangmanApp(tk.Tk):
         )
         keyboard_title.pack(pady=(20, 15))
 
-        key_container = tk.Frame(keyboard_frame, bg="#0a0a1f")
-        key_container.pack(pady=15, padx=40)
+        self._buildKeyboard(keyboard_frame)
 
-        # Define keyboard rows
-        rows = ["QWERTYUIOP", "ASDFGHJKL", "ZXCVBNM"]
-        
-        for i, row_letters in enumerate(rows):
-            row_frame = tk.Frame(key_container, bg="#0a0a1f")
-            row_frame.pack(pady=10)
-            
-            # Center the middle row (ASDFGHJKL)
-            if i == 1:  # Middle row
-                # Add left padding to center
-                left_spacer = tk.Frame(row_frame, bg="#0a0a1f", width=25)
-                left_spacer.pack(side="left")
-            
-            for char in row_letters:
-                btn = tk.Button(
-                    row_frame,
-                    text=char,
-                    width=6,
-                    height=2,
-                    font=("Consolas", 11, "bold"),
-                    fg="#000000",
-                    bg="#00ffff",
-                    activeforeground="#000511",
-                    activebackground="#66ffff",
-                    relief="solid",
-                    bd=1,
-                    highlightthickness=2,
-                    highlightbackground="#00ffff",
-                    command=lambda c=char: self._onGuess(c)
-                )
-                btn.pack(side="left", padx=3)
-                self.letter_buttons[char] = btn
-
-        # Bind physical keyboard
-        self.bind("<Key>", self._onPhysicalKey)
+        # Bind physical keyboard per letter so Tk drops every other key before
+        # it reaches Python
+        for key in string.ascii_letters:
+            self.bind(f"<KeyPress-{key}>", self._onPhysicalKey)
 
         # Command Center
         control_frame = tk.Frame(main_frame, bg="#0a0a1f", relief="solid", bd=1)
@@ -246,19 +370,13 @@ class HangmanApp(tk.Tk):
         # Quantum Hint Button
         self.hint_button = tk.Button(
             control_inner,
-            text=f"◉ NEURAL SCAN [-{HINT_COST} ENERGY]",
+            text=_HINT_BUTTON_TEXT,
             command=self._onHintButtonClicked,
-            font=("Consolas", 10, "bold"),
             fg="#000511",
             bg="#6666ff",
-            activeforeground="#000000",
             activebackground="#8888ff",
-            relief="solid",
-            bd=1,
-            highlightthickness=2,
             highlightbackground="#6666ff",
-            padx=20,
-            pady=8
+            **_CONTROL_BUTTON_STYLE
         )
         self.hint_button.pack(side="left", padx=10)
 
@@ -267,114 +385,197 @@ class HangmanApp(tk.Tk):
             control_inner,
             text="◈ SYSTEM RESET",
             command=self._onResetButtonClicked,
-            font=("Consolas", 10, "bold"),
             fg="#000000",
             bg="#ff3366",
-            activeforeground="#000000",
             activebackground="#ff6699",
-            relief="solid",
-            bd=1,
-            highlightthickness=2,
             highlightbackground="#ff3366",
-            padx=20,
-            pady=8
+            **_CONTROL_BUTTON_STYLE
         )
         self.reset_button.pack(side="left", padx=10)
 
+    def _buildKeyboard(self, parent: tk.Frame) -> None:
+        """
+        Draw the 26 letter keys onto a single canvas and route clicks through
+        one tag binding instead of creating a Button widget per letter.
+
+        Args:
+            parent: Frame the keyboard canvas is packed into.
+        """
+        canvas = tk.Canvas(
+            parent, width=_KEYBOARD_WIDTH, height=_KEYBOARD_HEIGHT, bg="#0a0a1f", highlightthickness=0
+        )
+        canvas.pack(pady=15, padx=40)
+        self.keyboard_canvas = canvas
+
+        create_rectangle = canvas.create_rectangle
+        create_text = canvas.create_text
+        pitch = _KEY_WIDTH + _KEY_GAP
+        for i, row_letters in enumerate(_KEY_ROWS):
+            y = _KEY_GAP + i * _KEY_ROW_PITCH
+            # Center each row; the middle row keeps its old half-spacer nudge right
+            x = (_KEYBOARD_WIDTH - len(row_letters) * pitch + _KEY_GAP) // 2 + (12 if i == 1 else 0)
+            for char in row_letters:
+                tags = ("key", _KEY_TAGS[char])
+                create_rectangle(x, y, x + _KEY_WIDTH, y + _KEY_HEIGHT, tags=tags, **_KEY_RECT_STYLE)
+                create_text(x + _KEY_WIDTH // 2, y + _KEY_HEIGHT // 2, text=char, tags=tags, **_KEY_TEXT_STYLE)
+                x += pitch
+
+        canvas.tag_bind("key", "<Button-1>", self._onKeyCanvasClick)
+
+    def _onKeyCanvasClick(self, event: tk.Event) -> None:  # type: ignore[name-defined]
+        """
+        Guess the letter whose key is under the pointer. Disabled keys never
+        become "current", so used letters do not reach this handler.
+        """
+        if self.keyboard_canvas is None:
+            return
+
+        for tag in self.keyboard_canvas.gettags(tk.CURRENT):
+            letter = _KEY_TAG_LETTERS.get(tag)
+            if letter is not None:
+                self._onGuess(letter)
+                return
+
     def _onCategoryChanged(self, new_category: object) -> object | None:
-        if self.category_var is not None:
+        """
+        Switch category and start a new game.
+
+        Args:
+            new_category: The category name, or the <<ComboboxSelected>> event,
+                in which case the choice is read from category_var.
+        """
+        if isinstance(new_category, str):
+            self.current_category = new_category
+        elif self.category_var is not None:
             self.current_category = self.category_var.get()
-        else:
-            self.current_category = str(new_category)
+            # Readonly comboboxes leave the chosen text highlighted
+            if self.category_menu is not None:
+                self.category_menu.selection_clear()
         self._startNewGame()
         return None
 
     def _startNewGame(self) -> None:
+        # Settle the old game's pending refresh first, so a guess that ended it
+        # still awards its score and shows its dialog before the game is replaced
+        if self._flush_scheduled:
+            self._flushUi()
+        self._dirty = 0
+        self._pending_letter = None
+
         secret_word = self.word_bank.getRandomWord(self.current_category)
         self.game = self.game_factory(secret_word)
+        self._used_upper = {used.upper() for used in self.game.used_letters}
         
         # UI Reset
+        # One config sets both the colour and the new masked word
         if self.word_label:
-            self.word_label.config(fg="#00ff41", text=self.game.getMaskedWord())
-        
-        self._updateWordLabel()
+            self._last_masked = self.game.getMaskedWord()
+            self.word_label.config(fg="#00ff41", text=self._last_masked)
+
         self._updateInfoLabel()
+        self._last_wrong_drawn = -1
         self._updateCanvas()
-        self._enableInput()
-        self._updateButtons()
+        self._resetKeyboard()
         self._updateHintButton()
         self._updateBonusLabel()
 
+    def _resetKeyboard(self) -> None:
+        """
+        Re-enable every letter key for a fresh game, then disable the
+        auto-revealed letters.
+        """
+        if self.game is None or self.keyboard_canvas is None:
+            return
+
+        self.keyboard_canvas.itemconfigure("key", state=tk.NORMAL)
+        for used in self._used_upper:
+            tag = _KEY_TAGS.get(used)
+            if tag is not None:
+                self.keyboard_canvas.itemconfigure(tag, state=tk.DISABLED)
+        self._disabled_keys = set(self._used_upper)
+
     def _updateBonusLabel(self) -> None:
         if self.bonus_label:
-            bonus_str = " ".join(sorted(AUTO_REVEAL_LETTERS)).upper()
-            self.bonus_label.config(text=f"◉ NEURAL BONUS MATRIX: {bonus_str} ACTIVATED")
+            self.bonus_label.config(text=_BONUS_TEXT)
 
     def _updateWordLabel(self) -> None:
-        if self.game is not None and self.word_label is not None:
-            self.word_label.config(text=self.game.getMaskedWord())
+        game = self.game
+        word_label = self.word_label
+        if game is not None and word_label is not None:
+            masked = game.getMaskedWord()
+            if masked != self._last_masked:
+                self._last_masked = masked
+                word_label.config(text=masked)
 
     def _updateInfoLabel(self) -> None:
-        if self.game is None or self.info_label is None:
+        game = self.game
+        if game is None or self.info_label is None:
             return
 
-        remaining_attempts = self.game.max_attempts - self.game.wrong_guesses
-        info_text = f"◉ ENERGY: {remaining_attempts}/{self.game.max_attempts} | SECTOR: {self.current_category.upper()} | SCORE: {self.score}"
+        max_attempts = game.max_attempts
+        remaining_attempts = max_attempts - game.wrong_guesses
+        # Compare the inputs rather than the text so unchanged refreshes skip formatting
+        key = (remaining_attempts, max_attempts, self.current_category, self.score)
+        if key == self._last_info_key:
+            return
+
+        self._last_info_key = key
+        info_text = f"◉ ENERGY: {remaining_attempts}/{max_attempts} | SECTOR: {self.current_category.upper()} | SCORE: {self.score}"
         self.info_label.config(text=info_text)
 
+    def _buildCanvasItems(self) -> None:
+        """
+        Draw the gallows and every body part once; parts start hidden and are
+        shown by _updateCanvas via their BODY_PART_TAGS tag.
+        """
+        canvas = self.canvas
+        hidden = tk.HIDDEN
+
+        # Backdrop item under everything; the wrong-guess flash recolours just this
+        self._bg_rect = canvas.create_rectangle(0, 0, 240, 300, fill=self.canvas_bg, width=0)
+
+        create = {
+            "oval": canvas.create_oval,
+            "line": canvas.create_line,
+            "rectangle": canvas.create_rectangle,
+            "text": canvas.create_text,
+        }
+
+        # Quantum Gallows Structure, always visible
+        for kind, coords, options in _GALLOWS_SPECS:
+            create[kind](*coords, **options)
+
+        # Body parts, hidden until _updateCanvas shows their tag
+        for tag, kind, coords, options in _PART_SPECS:
+            create[kind](*coords, state=hidden, tags=tag, **options)
+
     def _updateCanvas(self) -> None:
-        if self.game is None or self.canvas is None:
+        game = self.game
+        canvas = self.canvas
+        if game is None or canvas is None:
+            return
+
+        wrong = game.wrong_guesses
+        if wrong == self._last_wrong_drawn:
             return
+        self._last_wrong_drawn = wrong
 
-        self.canvas.delete("all")
-        self.canvas.configure(bg=self.canvas_bg)
-
-        # Quantum Gallows Structure
-        # Base platform
-        self.canvas.create_rectangle(50, 255, 170, 265, fill="#0a0a1f", outline="#00ffff", width=2)
-        # Main pillar
-        self.canvas.create_line(110, 255, 110, 50, fill="#00ffff", width=6, capstyle=tk.ROUND)
-        # Support beam
-        self.canvas.create_line(110, 50, 170, 50, fill="#00ffff", width=5, capstyle=tk.ROUND)
-        # Energy node
-        self.canvas.create_oval(165, 45, 175, 55, fill="#6666ff", outline="#3333ff", width=2)
-        # Plasma rope
-        self.canvas.create_line(170, 55, 170, 85, fill="#ff3366", width=4, capstyle=tk.ROUND, dash=(5, 2))
-
-        wrong = self.game.wrong_guesses
-
-        if wrong >= 1:  # Head - Neural interface
-            self.canvas.create_oval(155, 85, 185, 115, outline="#00ffff", width=4)
-            self.canvas.create_oval(160, 90, 180, 110, outline="#6666ff", width=2, fill="#000511")
-            # Neural nodes
-            self.canvas.create_oval(165, 95, 170, 100, fill="#00ffff", outline="#00ffff")
-            self.canvas.create_oval(170, 95, 175, 100, fill="#00ffff", outline="#00ffff")
-        if wrong >= 2:  # Body - Energy core
-            self.canvas.create_line(170, 110, 170, 190, fill="#00ffff", width=5)
-            # Core reactor
-            self.canvas.create_rectangle(165, 145, 175, 155, fill="#6666ff", outline="#9999ff", width=2)
-        if wrong >= 3:  # Left Arm - Plasma conduit
-            self.canvas.create_line(170, 130, 150, 160, fill="#ff3366", width=4)
-            self.canvas.create_oval(148, 158, 152, 162, fill="#ff3366", outline="#ff3366")
-        if wrong >= 4:  # Right Arm - Plasma conduit
-            self.canvas.create_line(170, 130, 190, 160, fill="#ff3366", width=4)
-            self.canvas.create_oval(188, 158, 192, 162, fill="#ff3366", outline="#ff3366")
-        if wrong >= 5:  # Left Leg - Quantum stabilizer
-            self.canvas.create_line(170, 190, 150, 220, fill="#6666ff", width=4)
-            self.canvas.create_oval(148, 218, 152, 222, fill="#00ffff", outline="#00ffff")
-        if wrong >= 6:  # Right Leg - Quantum stabilizer
-            self.canvas.create_line(170, 190, 190, 220, fill="#6666ff", width=4)
-            self.canvas.create_oval(188, 218, 192, 222, fill="#00ffff", outline="#00ffff")
-            # System overload effect
-            self.canvas.create_text(110, 280, text="⚠ SYSTEM OVERLOAD ⚠", fill="#ff3366", font=("Consolas", 10, "bold"))
+        # Show one tagged part per wrong guess; nothing is redrawn
+        itemconfigure = canvas.itemconfigure
+        shown, hidden = tk.NORMAL, tk.HIDDEN
+        for stage, tag in enumerate(BODY_PART_TAGS, start=1):
+            itemconfigure(tag, state=shown if wrong >= stage else hidden)
 
     def _autosizeWindowToContent(self) -> None:
         if not self.winfo_exists():
             return
 
-        self.update_idletasks()
-
+        # Scheduled with after_idle, so the initial layout has normally been
+        # computed already; only force a pass if the window is clearly unsized
         req_w = self.winfo_reqwidth()
+        if req_w < 100:
+            self.update_idletasks()
+            req_w = self.winfo_reqwidth()
         req_h = self.winfo_reqheight()
         screen_w = self.winfo_screenwidth()
         screen_h = self.winfo_screenheight()
@@ -386,24 +587,37 @@ class HangmanApp(tk.Tk):
         self.scroll_canvas.configure(scrollregion=self.scroll_canvas.bbox("all"))
 
     def _onPhysicalKey(self, event: tk.Event) -> None:  # type: ignore[name-defined]
-        if event.char and event.char.isalpha():
-            self._onGuess(event.char.upper())
+        letter = _KEYMAP.get(event.char)
+        if letter is not None:
+            self._onGuess(letter)
 
     def _onGuess(self, letter: str) -> None:
+        """
+        Guess a letter in either case; it is upper-cased to match _used_upper.
+        """
         if self.game is None or self.game.isFinished():
             return
 
-        if letter.lower() in self.game.used_letters:
+        letter = letter.upper()
+        if letter in self._used_upper:
             return
 
         was_correct = self.game.processGuess(letter)
+        self._used_upper.add(letter)
         if not was_correct:
             self.bell()  # System error beep
-            # Critical error flash
-            self.canvas.configure(bg="#2a0000")
-            self.after(150, lambda: self.canvas.configure(bg=self.canvas_bg))
+            # Critical error flash; a new miss restarts the timer instead of stacking restores
+            if self._flash_after_id is not None:
+                self.after_cancel(self._flash_after_id)
+            self.canvas.itemconfigure(self._bg_rect, fill="#2a0000")
+            self._flash_after_id = self.after(150, self._clearFlash)
 
-        self._refreshUiAfterAction()
+        self._refreshUiAfterAction(letter, _DIRTY_HIT if was_correct else _DIRTY_MISS)
+
+    def _clearFlash(self) -> None:
+        self._flash_after_id = None
+        if self.canvas is not None:
+            self.canvas.itemconfigure(self._bg_rect, fill=self.canvas_bg)
 
     def _onHintButtonClicked(self) -> None:
         if self.game is None or self.game.isFinished():
@@ -411,6 +625,7 @@ class HangmanApp(tk.Tk):
 
         revealed = self.game.useHint()
         if revealed:
+            self._used_upper.add(revealed.upper())
             messagebox.showinfo(
                 "◉ QUANTUM SCAN COMPLETE", 
                 f"Neural Network Analysis:\nRevealed: **{revealed.upper()}**\nEnergy Cost: {HINT_COST} units"
@@ -419,37 +634,109 @@ class HangmanApp(tk.Tk):
         else:
             messagebox.showwarning("Quantum Hint Unavailable", "⚠ Insufficient energy reserves!\nRequire more life units or all sectors scanned.")
 
-    def _refreshUiAfterAction(self) -> None:
+    def _refreshUiAfterAction(
+        self,
+        letter: Optional[str] = None,
+        parts: int = _DIRTY_ALL,
+    ) -> None:
+        """
+        Mark the UI parts an action changed as dirty; one idle-queue flush
+        redraws them, so repeated calls before it runs (key auto-repeat, fast
+        clicks) collapse into a single refresh.
+
+        Args:
+            letter: The letter just guessed, or None for a bulk key refresh.
+            parts: _DIRTY_* bits for the parts the action may have changed.
+        """
         if self.game is None:
             return
 
-        self._updateWordLabel()
-        self._updateInfoLabel()
-        self._updateCanvas()
-        self._updateButtons()
-        self._updateHintButton()
+        if not self._flush_scheduled:
+            self._pending_letter = letter
+        elif letter != self._pending_letter:
+            # Two different letters in one batch: fall back to the bulk key update
+            self._pending_letter = None
+        self._markDirty(parts)
+
+    def _markDirty(self, parts: int) -> None:
+        self._dirty |= parts
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flushUi)
+
+    def _flushUi(self) -> None:
+        if not self._flush_scheduled:
+            # Already flushed early (see _startNewGame); this idle callback is stale
+            return
+
+        dirty, self._dirty = self._dirty, 0
+        letter = self._pending_letter
+        self._flush_scheduled = False
+        self._pending_letter = None
+        if self.game is None:
+            return
+
+        if dirty & _DIRTY_WORD:
+            self._updateWordLabel()
+        if dirty & _DIRTY_INFO:
+            self._updateInfoLabel()
+        if dirty & _DIRTY_CANVAS:
+            self._updateCanvas()
+        if dirty & _DIRTY_KEYS:
+            self._updateButtons(letter)
+        if dirty & _DIRTY_HINT:
+            self._updateHintButton()
 
         if self.game.isWon():
             self._handleWin()
         elif self.game.isLost():
             self._handleLoss()
 
-    def _updateButtons(self) -> None:
-        if self.game is None:
+    def _updateButtons(self, letter: Optional[str] = None) -> None:
+        """
+        Grey out used letter keys.
+
+        Args:
+            letter: The letter just guessed; only its key is reconfigured. When
+                None (hint), every used letter not yet greyed out is reconfigured.
+        """
+        keyboard_canvas = self.keyboard_canvas
+        if self.game is None or keyboard_canvas is None:
             return
-            
-        for char, btn in self.letter_buttons.items():
-            if char.lower() in self.game.used_letters:
-                btn.config(state=tk.DISABLED, bg="#333366", fg="#6666ff")
-            else:
-                btn.config(state=tk.NORMAL, bg="#00ffff", fg="#000000")
+
+        if letter is not None:
+            letter = letter.upper()
+            # Only keys the current game has used; never grey one for a stale letter
+            pending = (letter,) if letter in self._used_upper else ()
+        else:
+            pending = self._used_upper - self._disabled_keys
+        itemconfigure = keyboard_canvas.itemconfigure
+        mark_disabled = self._disabled_keys.add
+        disabled = tk.DISABLED
+        for used in pending:
+            tag = _KEY_TAGS.get(used)
+            if tag is not None:
+                itemconfigure(tag, state=disabled)
+                mark_disabled(used)
 
     def _updateHintButton(self) -> None:
-        if self.game is None or self.hint_button is None:
+        game = self.game
+        if game is None or self.hint_button is None:
             return
-            
-        remaining = self.game.max_attempts - self.game.wrong_guesses
-        self.hint_button.config(state=tk.NORMAL if remaining >= HINT_COST else tk.DISABLED)
+
+        desired = tk.NORMAL if game.max_attempts - game.wrong_guesses >= HINT_COST else tk.DISABLED
+        if desired != self._last_hint_state:
+            self._setHintState(desired)
+
+    def _setHintState(self, state: str) -> None:
+        """
+        Configure the hint button and record the state so unchanged updates are skipped.
+
+        Args:
+            state: tk.NORMAL or tk.DISABLED.
+        """
+        self._last_hint_state = state
+        self.hint_button.config(state=state)
 
     def _handleWin(self) -> None:
         self._disableInput()
@@ -465,38 +752,58 @@ class HangmanApp(tk.Tk):
         self.lift()
         self.attributes("-topmost", True)
         self.after(100, lambda: self.attributes("-topmost", False))
-        
-        messagebox.showinfo(
-            "◉ DECRYPTION SUCCESS!", 
+
+        # Show the dialog from the event loop so the final frame paints first;
+        # the text is bound now, before another game can start
+        self.after(0, partial(
+            messagebox.showinfo,
+            "◉ DECRYPTION SUCCESS!",
             f"Network Access Granted!\nTarget: **{self.game.secret_word.upper()}**\nPoints Awarded: +{points} | Total Score: {self.score}"
-        )
+        ))
 
     def _handleLoss(self) -> None:
         self._disableInput()
         if self.word_label and self.game:
-            self.word_label.config(text=self.game.secret_word.upper(), fg="#ff0000")
-        self._updateCanvas()
+            self._last_masked = self.game.secret_word.upper()
+            self.word_label.config(text=self._last_masked, fg="#ff0000")
         # Ensure messagebox appears on top
         self.lift()
         self.attributes("-topmost", True)
         self.after(100, lambda: self.attributes("-topmost", False))
-        
-        messagebox.showinfo(
-            "◉ SYSTEM BREACH DETECTED", 
+
+        self.after(0, partial(
+            messagebox.showinfo,
+            "◉ SYSTEM BREACH DETECTED",
             f"Decryption Protocol Failed!\nTarget: **{self.game.secret_word.upper()}**\nFinal Score: {self.score}"
-        )
+        ))
 
     def _disableInput(self) -> None:
-        for btn in self.letter_buttons.values():
-            btn.config(state=tk.DISABLED)
+        if self.keyboard_canvas:
+            self.keyboard_canvas.itemconfigure("key", state=tk.DISABLED)
         if self.hint_button:
-            self.hint_button.config(state=tk.DISABLED)
-
-    def _enableInput(self) -> None:
-        for btn in self.letter_buttons.values():
-            btn.config(state=tk.NORMAL)
-        if self.hint_button:
-            self.hint_button.config(state=tk.NORMAL)
+            self._setHintState(tk.DISABLED)
 
     def _onResetButtonClicked(self) -> None:
         self._startNewGame()
+
+    def runAsync(self, frame_interval: float = _ASYNC_FRAME_INTERVAL) -> None:
+        """
+        Run the app under an asyncio event loop instead of mainloop().
+
+        Tk events are pumped between awaits, so coroutines scheduled on the same
+        loop (e.g. a future network word fetch) run without freezing the window.
+        Returns once the window has been destroyed.
+
+        Args:
+            frame_interval: Seconds to yield to asyncio between Tk event pumps.
+        """
+        asyncio.run(self._pumpTkEvents(frame_interval))
+
+    async def _pumpTkEvents(self, frame_interval: float) -> None:
+        try:
+            while True:
+                self.update()
+                await asyncio.sleep(frame_interval)
+        except tk.TclError:
+            # update() on a destroyed window; the app has closed
+            return
@@ -9,15 +9,43 @@ word lists used in the Hangman game. It allows for words to be organized into
 categories, and provides methods to retrieve categories and select random words.
 
 Author: @seanl
-Version: 1.1.0
+Version: 1.6.1
 Creation Date: 11/20/2025
-Last Updated: 12/25/2025
+Last Updated: 10/15/2026
 """
 
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 import random
+import sys
 
-DEFAULT_CATEGORY: str = "general"
+DEFAULT_CATEGORY: str = sys.intern("general")
+
+# Bound once so deck refills skip the module attribute lookup
+_sample = random.sample
+
+# Built-in categories, shared read-only by every default WordBank. The word
+# lists are tuples and the names interned, so lookups with an interned name
+# compare by identity. Extend this with more categories and words as needed.
+_CATEGORY_DATA: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    sys.intern(name): words for name, words in {
+        "general": ("python", "hangman", "developer", "keyboard", "algorithm", "variable", "database", "interface", "framework", "encryption"),
+        "animals": ("elephant", "giraffe", "kangaroo", "alligator", "platypus", "rhinoceros", "penguin", "cheetah", "dolphin", "octopus"),
+        "fruits": ("banana", "strawberry", "pineapple", "watermelon", "blueberry", "pomegranate", "mango", "kiwi", "coconut", "papaya"),
+        "movies": ("inception", "gladiator", "titanic", "avatar", "matrix", "godfather", "interstellar", "joker", "parasite", "dune"),
+        "countries": ("australia", "brazil", "canada", "denmark", "egypt", "france", "japan", "mexico", "norway", "portugal"),
+        "science": ("physics", "chemistry", "biology", "astronomy", "quantum", "gravity", "evolution", "molecule", "ecosystem", "hypothesis"),
+        "winter 2025": ("blizzard", "snowflake", "hibernate", "avalanche", "frostbite", "snowstorm", "icicle", "reindeer", "polar", "solstice"),
+        "minecraft": ("creeper", "diamond", "crafting", "redstone", "zombie", "steve", "enderman", "nether", "obsidian", "enchantment"),
+        "among us": ("impostor", "suspect", "vent", "emergency", "crewmate", "sabotage", "medbay", "reactor", "oxygen", "electrical"),
+        "fortnite": ("battle", "victory", "chug", "storm", "island", "building", "zero", "marvel", "legendary", "supply"),
+        "coding": ("boolean", "function", "variable", "debug", "syntax", "compile", "recursion", "iteration", "polymorphism", "abstraction"),
+        "space": ("galaxy", "nebula", "astronaut", "telescope", "planet", "asteroid", "cosmos", "satellite", "meteor", "universe"),
+        "superheroes": ("thor", "wonder", "batman", "superman", "hulk", "widow", "panther", "vision", "quicksilver", "antman"),
+        "fantasy": ("dragon", "wizard", "kingdom", "sorcery", "potion", "unicorn", "dungeon", "phoenix", "troll", "enchanted"),
+        "ocean": ("submarine", "coral", "shipwreck", "treasure", "hurricane", "lighthouse", "buoy", "tsunami", "whale", "dolphin"),
+    }.items()
+})
 
 
 class WordBank:
@@ -25,54 +53,63 @@ class WordBank:
     Manages categories of words for the Hangman game.
     """
 
-    def __init__(self) -> None:
-        self.categories: Dict[str, List[str]] = {}
-        self._initializeDefaultCategories()
-
-    def _initializeDefaultCategories(self) -> None:
+    def __init__(self, categories: Optional[Mapping[str, Sequence[str]]] = None) -> None:
         """
-        Initialize some default word categories.
-        Extend this with more categories and words as needed.
+        Args:
+            categories: Optional category -> words mapping to use instead of the
+                built-in _CATEGORY_DATA (e.g. a small fixture bank in tests).
         """
-        self.categories = {
-            "general": ["python", "hangman", "developer", "keyboard", "algorithm", "variable", "database", "interface", "framework", "encryption"],
-            "animals": ["elephant", "giraffe", "kangaroo", "alligator", "platypus", "rhinoceros", "penguin", "cheetah", "dolphin", "octopus"],
-            "fruits": ["banana", "strawberry", "pineapple", "watermelon", "blueberry", "pomegranate", "mango", "kiwi", "coconut", "papaya"],
-            "movies": ["inception", "gladiator", "titanic", "avatar", "matrix", "godfather", "interstellar", "joker", "parasite", "dune"],
-            "countries": ["australia", "brazil", "canada", "denmark", "egypt", "france", "japan", "mexico", "norway", "portugal"],
-            "science": ["physics", "chemistry", "biology", "astronomy", "quantum", "gravity", "evolution", "molecule", "ecosystem", "hypothesis"],
-            "winter 2025": ["blizzard", "snowflake", "hibernate", "avalanche", "frostbite", "snowstorm", "icicle", "reindeer", "polar", "solstice"],
-            "minecraft": ["creeper", "diamond", "crafting", "redstone", "zombie", "steve", "enderman", "nether", "obsidian", "enchantment"],
-            "among us": ["impostor", "suspect", "vent", "emergency", "crewmate", "sabotage", "medbay", "reactor", "oxygen", "electrical"],
-            "fortnite": ["battle", "victory", "chug", "storm", "island", "building", "zero", "marvel", "legendary", "supply"],
-            "coding": ["boolean", "function", "variable", "debug", "syntax", "compile", "recursion", "iteration", "polymorphism", "abstraction"],
-            "space": ["galaxy", "nebula", "astronaut", "telescope", "planet", "asteroid", "cosmos", "satellite", "meteor", "universe"],
-            "superheroes": ["thor", "wonder", "batman", "superman", "hulk", "widow", "panther", "vision", "quicksilver", "antman"],
-            "fantasy": ["dragon", "wizard", "kingdom", "sorcery", "potion", "unicorn", "dungeon", "phoenix", "troll", "enchanted"],
-            "ocean": ["submarine", "coral", "shipwreck", "treasure", "hurricane", "lighthouse", "buoy", "tsunami", "whale", "dolphin"],
-        }
-
-    def getCategories(self) -> List[str]:
+        self.categories: Mapping[str, Sequence[str]] = (
+            _CATEGORY_DATA if categories is None else categories
+        )
+        # Category names are fixed once the bank is built; hand out one shared tuple
+        self._categories_tuple: Tuple[str, ...] = tuple(self.categories)
+        # Shuffled words still to be dealt per category; see getRandomWord
+        self._decks: Dict[str, List[str]] = {}
+        self._last_dealt: Dict[str, str] = {}
+
+    def getCategories(self) -> Tuple[str, ...]:
         """
-        Return a list of available category names.
+        Return the available category names, as captured at construction.
         """
-        return list(self.categories.keys())
+        return self._categories_tuple
 
-    def getWordsForCategory(self, category_name: str) -> List[str]:
+    def getWordsForCategory(self, category_name: str) -> Sequence[str]:
         """
-        Return a list of words for the given category.
+        Return the words for the given category (a tuple for the built-in bank).
         If the category does not exist, falls back to DEFAULT_CATEGORY.
         """
-        if category_name not in self.categories:
-            category_name = DEFAULT_CATEGORY
-        return self.categories.get(category_name, [])
+        words = self.categories.get(category_name)
+        if words is None:
+            words = self.categories.get(DEFAULT_CATEGORY, ())
+        return words
 
     def getRandomWord(self, category_name: str = DEFAULT_CATEGORY) -> str:
         """
         Return a random word from the given category.
+
+        Words are dealt from a shuffled deck per category, so none repeats until
+        the whole category has been played; each refill is shuffled so its first
+        word differs from the last one dealt.
         """
-        words = self.getWordsForCategory(category_name)
+        # Same lookup as getWordsForCategory, inlined to skip the extra call
+        deck_key = category_name
+        words = self.categories.get(category_name)
+        if words is None:
+            deck_key = DEFAULT_CATEGORY
+            words = self.categories.get(DEFAULT_CATEGORY)
         if not words:
             # Fallback: in case the category is empty/misconfigured.
             raise ValueError(f"No words available for category '{category_name}'")
-        return random.choice(words)
+
+        deck = self._decks.get(deck_key)
+        if not deck:
+            deck = _sample(words, len(words))
+            # Words are popped from the end; keep the previous word off the top
+            if len(deck) > 1 and deck[-1] == self._last_dealt.get(deck_key):
+                deck[0], deck[-1] = deck[-1], deck[0]
+            self._decks[deck_key] = deck
+
+        word = deck.pop()
+        self._last_dealt[deck_key] = word
+        return word